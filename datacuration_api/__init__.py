@@ -7,9 +7,22 @@ allowing for file processing, text extraction, and data enrichment.
 
 __version__ = "0.1.0"
 
+from typing import TYPE_CHECKING, Any
+
 # Import main components for easy access
-from .client import DataCurationClient
+from .client import DataCurationClient, decode_options, encode_options
 from .config import config
 
+if TYPE_CHECKING:
+    from .aclient import AsyncDataCurationClient
+
+
+def __getattr__(name: str) -> Any:
+    """Import the async client, and with it asyncio, only when it is used."""
+    if name == "AsyncDataCurationClient":
+        from .aclient import AsyncDataCurationClient
+        return AsyncDataCurationClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Export main components
-__all__ = ["DataCurationClient", "config"]
+__all__ = ["DataCurationClient", "AsyncDataCurationClient", "config", "decode_options", "encode_options"]
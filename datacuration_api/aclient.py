@@ -0,0 +1,133 @@
+"""
+Asynchronous Data Curation API client.
+
+This module provides an asyncio interface to the Hyland Data Curation API, so that
+many files can be processed concurrently from async applications.
+"""
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import Dict, Any, List, Optional, Type
+
+from .client import DataCurationClient, Options
+
+logger = logging.getLogger(__name__)
+
+# Number of files processed concurrently by process_many
+DEFAULT_CONCURRENCY = 8
+
+
+class AsyncDataCurationClient:
+    """
+    Asyncio client for the Hyland Data Curation API.
+    
+    Each call runs the matching DataCurationClient method in a worker thread, so
+    the event loop is never blocked. All calls share the wrapped client's pooled
+    connections and access token.
+    """
+    
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        client: Optional[DataCurationClient] = None
+    ) -> None:
+        """
+        Initialize the async API client.
+        
+        Args:
+            client_id: Optional client ID. If not provided, it will be loaded from config.
+            client_secret: Optional client secret. If not provided, it will be loaded from config.
+            client: Optional synchronous client to wrap. It is used as is and is not
+                closed by close(). If not provided, the async client creates and
+                owns one.
+        """
+        self._owns_client = client is None
+        self._client = client if client is not None else DataCurationClient(client_id, client_secret)
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session if this client created it."""
+        if self._owns_client:
+            self._client.close()
+    
+    async def __aenter__(self) -> "AsyncDataCurationClient":
+        """Return the client itself when used as an async context manager."""
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the HTTP session when leaving the async context manager."""
+        await self.close()
+    
+    async def upload_file(self, file_path: str, options: Optional[Options] = None, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Upload a file to the Data Curation API.
+        
+        Args:
+            file_path: Path to the file to upload.
+            options: Optional processing options. See DataCurationClient.presign().
+            **kwargs: Additional arguments passed to DataCurationClient.upload_file().
+        
+        Returns:
+            Dict containing job_id, put_url, and get_url.
+        """
+        return await asyncio.to_thread(self._client.upload_file, file_path, options, **kwargs)
+    
+    async def get_results(self, get_url: str) -> str:
+        """
+        Get the results of the data curation process.
+        
+        Args:
+            get_url: URL to retrieve the results from.
+        
+        Returns:
+            The curated text.
+        """
+        return await asyncio.to_thread(self._client.get_results, get_url)
+    
+    async def process_file(self, file_path: str, options: Optional[Options] = None, **kwargs: Any) -> str:
+        """
+        Process a file through the Data Curation API and retrieve the results.
+        
+        Args:
+            file_path: Path to the file to process.
+            options: Optional processing options. See DataCurationClient.presign().
+            **kwargs: Additional arguments passed to DataCurationClient.process_file().
+        
+        Returns:
+            The curated text.
+        """
+        return await asyncio.to_thread(self._client.process_file, file_path, options, **kwargs)
+    
+    async def process_many(
+        self,
+        file_paths: List[str],
+        options: Optional[Options] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **kwargs: Any
+    ) -> List[str]:
+        """
+        Process several files concurrently.
+        
+        Args:
+            file_paths: Paths to the files to process.
+            options: Optional processing options used for every file.
+            concurrency: Maximum number of files processed at the same time.
+            **kwargs: Additional arguments passed to DataCurationClient.process_file().
+        
+        Returns:
+            The results, in the same order as file_paths.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def process_one(file_path: str) -> str:
+            async with semaphore:
+                return await self.process_file(file_path, options, **kwargs)
+        
+        logger.info("Processing %s files with concurrency %s", len(file_paths), concurrency)
+        return list(await asyncio.gather(*(process_one(file_path) for file_path in file_paths)))
@@ -5,35 +5,295 @@ This module provides the core functionality to interact with the Hyland Data Cur
 including authentication, file upload, and result retrieval.
 """
 
+import os
 import json
 import time
+import random
 import logging
-from typing import Dict, Any, Optional, Tuple, BinaryIO
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import BinaryIO, Callable, Dict, Any, List, Optional, Tuple, Type, TypeVar, Union
 import requests
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolKey
+from urllib3.util.retry import Retry
 
 from .config import config
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+# Use orjson for JSON encoding and decoding when it is installed
+try:
+    import orjson
+    
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Set up logging; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Connect and read timeouts in seconds for API requests
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+# Slowest upload rate in bytes per second assumed when scaling upload read timeouts
+MIN_UPLOAD_RATE = 256 * 1024
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Size in bytes of the blocks read from upload bodies and written to the socket
+SEND_BLOCKSIZE = 1 << 20
+
+# Whether the installed urllib3 accepts a connection blocksize; 1.26, which
+# requests < 2.30 requires, rejects it as an unknown pool key
+URLLIB3_HAS_BLOCKSIZE = "key_blocksize" in PoolKey._fields
+
+# Transport-level retries for throttling and transient gateway errors. POST is
+# included because repeating an auth or presign request is harmless: at worst
+# an unused presigned job expires
+HTTP_RETRIES = 5
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_STATUSES = (429, 502, 503, 504)
+HTTP_RETRY_METHODS = frozenset(["GET", "HEAD", "PUT", "POST"])
+
+# Polling backoff defaults for process_file
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_JITTER = 0.5
+
+# Number of files processed concurrently by process_files
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# Status codes returned by the result URL while the job is still running
+RESULTS_NOT_READY_CODES = (403, 404)
+
+# Size in bytes of the chunks read when streaming results
+RESULTS_CHUNK_SIZE = 64 * 1024
+
+
+# Processing options, either as a dictionary or already encoded as JSON
+Options = Union[Dict[str, Any], str, bytes]
+
+# Result type of a polling check
+T = TypeVar("T")
+
+
+def encode_options(options: Options) -> bytes:
+    """
+    Encode processing options as a JSON request body.
+    
+    Args:
+        options: Options dictionary, or options already encoded as JSON.
+        
+    Returns:
+        The JSON encoded options.
+    """
+    if isinstance(options, bytes):
+        return options
+    if isinstance(options, str):
+        return options.encode("utf-8")
+    return _json_dumps(options)
+
+
+def decode_options(options: Union[str, bytes]) -> Any:
+    """
+    Decode processing options encoded as JSON.
+    
+    Args:
+        options: The JSON encoded options.
+        
+    Returns:
+        The decoded options.
+        
+    Raises:
+        ValueError: If the options are not valid JSON.
+    """
+    return _json_loads(options)
+
+
+def _backoff_delay(attempt: int, base_delay: float, max_delay: float, jitter: float) -> float:
+    """
+    Compute a capped exponential backoff delay with random jitter.
+    
+    Args:
+        attempt: Zero-based number of waits already performed.
+        base_delay: Delay used for the first wait in seconds.
+        max_delay: Upper bound for the exponential part of the delay in seconds.
+        jitter: Maximum random delay in seconds added on top.
+        
+    Returns:
+        The number of seconds to wait.
+    """
+    return min(max_delay, base_delay * 2.0 ** attempt) + random.uniform(0, jitter)
+
+
+class _BlockSizeAdapter(HTTPAdapter):
+    """HTTP adapter whose connections send request bodies in SEND_BLOCKSIZE blocks, when supported."""
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager, with large send blocks if urllib3 supports them."""
+        # urllib3 reads file bodies and sends them in 16 KiB blocks by default,
+        # which costs one read and one sendall call per block on large uploads
+        if URLLIB3_HAS_BLOCKSIZE:
+            kwargs.setdefault("blocksize", SEND_BLOCKSIZE)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _create_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """
+    Create a requests session with a connection pool and transient error retries.
+    
+    Args:
+        pool_maxsize: Maximum number of connections kept open per host. The auth,
+            API and storage hosts each get their own pool of this size.
+    
+    Returns:
+        The configured session.
+    """
+    session = requests.Session()
+    # Throttled requests and transient gateway errors are retried on the pooled
+    # connection, honoring any Retry-After header sent by the server. Streamed
+    # upload bodies are rewound by urllib3 before each retry
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=HTTP_RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = _BlockSizeAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Get the delay in seconds requested by a Retry-After response header.
+    
+    Args:
+        response: The HTTP response.
+        
+    Returns:
+        The delay in seconds, or None if the header is missing or not a number
+        of seconds.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _log_request_error(method: str, url: str, error: requests.RequestException) -> None:
+    """
+    Log a failed request, with the error response body when there is one.
+    
+    Args:
+        method: HTTP method.
+        url: URL the request was sent to.
+        error: The exception raised for the request.
+    """
+    logger.error("%s %s failed: %s", method, url, error)
+    if error.response is not None:
+        logger.error("Response content: %s", error.response.text)
+
 
 class DataCurationClient:
     """Client for interacting with the Hyland Data Curation API."""
     
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        pool_size: int = POOL_MAXSIZE
+    ) -> None:
         """
         Initialize the API client.
         
         Args:
             client_id: Optional client ID. If not provided, it will be loaded from config.
             client_secret: Optional client secret. If not provided, it will be loaded from config.
+            session: Optional requests session to send all requests through. It is
+                used as is and is not closed by close(). If not provided, the client
+                creates and owns a pooled session.
+            timeout: Connect and read timeouts in seconds for each request. Upload
+                read timeouts are raised for large files.
+            pool_size: Maximum number of connections kept open per host by the
+                session the client creates. Ignored when a session is given.
         """
         if client_id:
             config.update(client_id=client_id)
         if client_secret:
             config.update(client_secret=client_secret)
+        
+        # Share one session across all calls so connections to the auth, API
+        # and storage hosts are kept alive and reused between requests
+        self._owns_session = session is None
+        self._session = session if session is not None else _create_session(pool_size)
+        
+        # Bounds every request so a stalled connection cannot hang a call forever
+        self._timeout = timeout
+        
+        # Serializes token refreshes so concurrent callers share one auth request
+        self._token_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self) -> "DataCurationClient":
+        """Return the client itself when used as a context manager."""
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the HTTP session when leaving the context manager."""
+        self.close()
+    
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the session and raise if it is not successful.
+        
+        Args:
+            method: HTTP method.
+            url: URL to send the request to.
+            **kwargs: Additional arguments passed to requests.Session.request().
+                The client timeout is used unless a timeout is given.
+            
+        Returns:
+            The successful response.
+            
+        Raises:
+            requests.RequestException: If the request fails or returns an error status.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        try:
+            response = self._session.request(method, url, **kwargs)
+            logger.info("%s %s response code: %s", method, url, response.status_code)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            _log_request_error(method, url, e)
+            raise
     
     def authenticate(self) -> str:
         """
@@ -48,35 +308,49 @@ class DataCurationClient:
         """
         config.validate()
         
-        logger.info(f"Authenticating with endpoint: {config.auth_endpoint}")
+        logger.info("Authenticating with endpoint: %s", config.auth_endpoint)
         
         # Make a POST request to the auth endpoint
-        try:
-            response = requests.post(
-                config.auth_endpoint,
-                data=config.get_token_request_data(),
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded"
-                }
-            )
-            
-            logger.info(f"Auth response status code: {response.status_code}")
-            response.raise_for_status()
-            token_data = response.json()
-            
-            # Store the access token and expiry time
-            config.access_token = token_data["access_token"]
-            config.token_expiry = token_data.get("expires_in", 900)  # Default to 15 minutes if not provided
-            
-            logger.info("Authentication successful")
-            return config.access_token
-        except requests.RequestException as e:
-            logger.error(f"Authentication failed: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
-            raise
+        response = self._request(
+            "POST",
+            config.auth_endpoint,
+            data=config.get_token_request_data(),
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
+        )
+        token_data = _json_loads(response.content)
+        
+        # Store the access token and expiry time
+        access_token: str = token_data["access_token"]
+        config.set_access_token(
+            access_token,
+            token_data.get("expires_in", 900)  # Default to 15 minutes if not provided
+        )
+        
+        logger.info("Authentication successful")
+        return access_token
+    
+    def _ensure_token(self) -> None:
+        """
+        Make sure a valid access token is available, authenticating if needed.
+        
+        Only one thread fetches a new token at a time; others wait for it and
+        reuse the result.
+        
+        Raises:
+            ValueError: If client_id or client_secret is missing.
+            requests.RequestException: If the authentication request fails.
+        """
+        if config.token_valid():
+            return
+        with self._token_lock:
+            # Another thread may have refreshed the token while we were waiting,
+            # or an earlier run may have left a valid token in the token cache
+            if not config.token_valid() and not config.load_cached_token():
+                self.authenticate()
     
-    def presign(self, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def presign(self, options: Optional[Options] = None) -> Dict[str, Any]:
         """
         Call the presign endpoint to get URLs for file upload and result retrieval.
         
@@ -89,6 +363,8 @@ class DataCurationClient:
                 chunk_size (int): The target size (in characters) for each chunk when chunking is enabled
                 embedding (bool): When true, generates vector embeddings for the document or chunks
                 json_schema (bool): When true, returns the output in a structured JSON format
+                The options may also be given already encoded as a JSON string or bytes,
+                which is sent as is. Callers reusing the same options can encode them once.
             
             Example:
                 {
@@ -112,35 +388,26 @@ class DataCurationClient:
         config.validate()
         
         # Ensure we have a valid access token
-        if not config.access_token:
-            self.authenticate()
+        self._ensure_token()
         
         # Default options if none provided
         if options is None:
             options = {}
         
-        logger.info(f"Calling presign endpoint: {config.presign_endpoint}")
-        logger.info(f"Presign options: {options}")
+        logger.info("Calling presign endpoint: %s", config.presign_endpoint)
+        logger.info("Presign options: %r", options)
         
-        try:
-            response = requests.post(
-                config.presign_endpoint,
-                headers=config.get_auth_headers(),
-                json=options
-            )
-            
-            logger.info(f"Presign response status code: {response.status_code}")
-            response.raise_for_status()
-            result: Dict[str, Any] = response.json()
-            logger.info(f"Presign successful, job_id: {result.get('job_id', 'unknown')}")
-            return result
-        except requests.RequestException as e:
-            logger.error(f"Presign request failed: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
-            raise
+        response = self._request(
+            "POST",
+            config.presign_endpoint,
+            headers=config.get_auth_headers(),
+            data=encode_options(options)
+        )
+        result: Dict[str, Any] = _json_loads(response.content)
+        logger.info("Presign successful, job_id: %s", result.get('job_id', 'unknown'))
+        return result
     
-    def upload_file(self, file_path: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def upload_file(self, file_path: str, options: Optional[Options] = None) -> Dict[str, Any]:
         """
         Upload a file to the Data Curation API.
         
@@ -156,45 +423,52 @@ class DataCurationClient:
             ValueError: If the API token is missing.
             requests.RequestException: If the API request fails.
         """
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            logger.error(f"File not found: {file_path}")
+        # A single stat both checks the file exists and gives its size
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            logger.error("File not found: %s", file_path)
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        logger.info(f"Uploading file: {file_path}")
-        logger.info(f"File size: {file_path_obj.stat().st_size} bytes")
+        logger.info("Uploading file: %s", file_path)
+        logger.info("File size: %s bytes", file_size)
         
         # Get presigned URLs
         presign_data = self.presign(options)
+        put_url = presign_data['put_url']
         
-        # Upload file to the put_url
-        try:
-            with open(file_path_obj, 'rb') as file:
-                file_content = file.read()
-                file_size = len(file_content)
-                
-                logger.info(f"Uploading to put_url: {presign_data['put_url']}")
-                
-                response = requests.put(
-                    presign_data['put_url'],
-                    data=file_content,
-                    headers={
-                        "Content-Type": "application/octet-stream",
-                        "Content-Length": str(file_size)
-                    }
-                )
-                
-                logger.info(f"Upload response status code: {response.status_code}")
-                response.raise_for_status()
-                logger.info("File upload successful")
-        except requests.RequestException as e:
-            logger.error(f"File upload failed: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
-            raise
+        # Stream the file from disk rather than reading it into memory first
+        with open(file_path, 'rb') as file:
+            logger.info("Uploading to put_url: %s", put_url)
+            
+            self._request(
+                "PUT",
+                put_url,
+                data=file,
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(file_size)
+                },
+                timeout=self._upload_timeout(file_size)
+            )
+            logger.info("File upload successful")
         
         return presign_data
     
+    def _upload_timeout(self, size: int) -> Tuple[float, float]:
+        """
+        Get the timeouts for uploading a body of the given size.
+        
+        Args:
+            size: Size of the request body in bytes.
+            
+        Returns:
+            The connect timeout and a read timeout long enough to upload size
+            bytes at MIN_UPLOAD_RATE.
+        """
+        connect_timeout, read_timeout = self._timeout
+        return connect_timeout, max(read_timeout, size / MIN_UPLOAD_RATE)
+    
     def check_status(self, job_id: str) -> Dict[str, Any]:
         """
         Check the status of a data curation job.
@@ -209,28 +483,15 @@ class DataCurationClient:
             ValueError: If the access token is missing.
             requests.RequestException: If the API request fails.
         """
-        if not config.access_token:
-            self.authenticate()
+        self._ensure_token()
         
-        status_url = f"{config.status_endpoint}/{job_id}"
-        logger.info(f"Checking job status at: {status_url}")
+        status_url = config.get_status_url(job_id)
+        logger.info("Checking job status at: %s", status_url)
         
-        try:
-            response = requests.get(
-                status_url,
-                headers=config.get_auth_headers()
-            )
-            
-            logger.info(f"Status check response code: {response.status_code}")
-            response.raise_for_status()
-            result: Dict[str, Any] = response.json()
-            logger.info(f"Status check result: {result}")
-            return result
-        except requests.RequestException as e:
-            logger.error(f"Status check failed: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
-            raise
+        response = self._request("GET", status_url, headers=config.get_auth_headers())
+        result: Dict[str, Any] = _json_loads(response.content)
+        logger.debug("Status check result: %s", result)
+        return result
     
     def get_results(self, get_url: str) -> str:
         """
@@ -245,28 +506,192 @@ class DataCurationClient:
         Raises:
             requests.RequestException: If the API request fails.
         """
-        logger.info(f"Getting results from: {get_url}")
+        logger.info("Getting results from: %s", get_url)
+        
+        response = self._request("GET", get_url)
+        result = str(response.text)
+        logger.info("Results retrieved, length: %s characters", len(result))
+        return result
+    
+    def get_results_stream(self, get_url: str, sink: BinaryIO, chunk_size: int = RESULTS_CHUNK_SIZE) -> int:
+        """
+        Write the results of the data curation process to a binary file object.
+        
+        Unlike get_results(), the results are copied in chunks as they arrive and
+        are never held in memory as a whole.
+        
+        Args:
+            get_url: URL to retrieve the results from.
+            sink: Binary file object the results are written to.
+            chunk_size: Size in bytes of the chunks read from the response.
+            
+        Returns:
+            The number of bytes written.
+            
+        Raises:
+            requests.RequestException: If the API request fails.
+        """
+        logger.info("Streaming results from: %s", get_url)
         
+        with self._request("GET", get_url, stream=True) as response:
+            return self._copy_results(response, sink, chunk_size)
+    
+    def _copy_results(self, response: requests.Response, sink: BinaryIO, chunk_size: int) -> int:
+        """
+        Copy a streamed results response to a binary file object.
+        
+        Args:
+            response: The results response, requested with stream=True.
+            sink: Binary file object the results are written to.
+            chunk_size: Size in bytes of the chunks read from the response.
+            
+        Returns:
+            The number of bytes written.
+        """
+        total = 0
+        for chunk in response.iter_content(chunk_size):
+            sink.write(chunk)
+            total += len(chunk)
+        logger.info("Results retrieved, length: %s bytes", total)
+        return total
+    
+    def _get_results_if_ready(
+        self,
+        get_url: str,
+        stream: bool = False
+    ) -> Tuple[Optional[requests.Response], Optional[float]]:
+        """
+        Get the results of the data curation process if they are available yet.
+        
+        Args:
+            get_url: URL to retrieve the results from.
+            stream: Whether to leave the body of the results response unread.
+            
+        Returns:
+            A tuple of the results response, or None if the results are not
+            available yet, and the number of seconds the server asked to wait
+            before trying again through a Retry-After header, if any.
+            
+        Raises:
+            requests.RequestException: If the request fails for another reason.
+        """
         try:
-            response = requests.get(get_url)
-            logger.info(f"Get results response code: {response.status_code}")
+            response = self._session.get(get_url, stream=stream, timeout=self._timeout)
+            logger.debug("Get results response code: %s", response.status_code)
+            if response.status_code in RESULTS_NOT_READY_CODES:
+                response.close()
+                return None, _retry_after(response)
             response.raise_for_status()
-            result = str(response.text)
-            logger.info(f"Results retrieved, length: {len(result)} characters")
-            return result
+            return response, None
         except requests.RequestException as e:
-            logger.error(f"Get results failed: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
+            _log_request_error("GET", get_url, e)
             raise
     
+    def _wait_for_results(
+        self,
+        get_url: str,
+        max_retries: int,
+        retry_delay: float,
+        max_delay: float,
+        jitter: float,
+        timeout: Optional[float],
+        stream: bool = False
+    ) -> requests.Response:
+        """
+        Poll the result URL until the results are available.
+        
+        Args:
+            get_url: URL to retrieve the results from.
+            max_retries: Maximum number of readiness checks. Ignored when a timeout is given.
+            retry_delay: Initial delay between readiness checks in seconds.
+            max_delay: Upper bound for the delay between readiness checks in seconds.
+            jitter: Maximum random delay in seconds added to each wait.
+            timeout: Optional wall-clock budget in seconds.
+            stream: Whether to leave the body of the results response unread.
+            
+        Returns:
+            The results response.
+            
+        Raises:
+            requests.RequestException: If the API request fails.
+            TimeoutError: If max_retries or timeout is reached.
+        """
+        # The result URL is not available (403/404) until the job is done
+        def check(attempt: int) -> Tuple[Optional[requests.Response], Optional[float]]:
+            logger.debug("Checking for results (attempt %s)", attempt + 1)
+            return self._get_results_if_ready(get_url, stream=stream)
+        
+        return self._poll(check, max_retries, retry_delay, max_delay, jitter, timeout)
+    
+    def _poll(
+        self,
+        check: Callable[[int], Tuple[Optional[T], Optional[float]]],
+        max_retries: int,
+        retry_delay: float,
+        max_delay: float,
+        jitter: float,
+        timeout: Optional[float]
+    ) -> T:
+        """
+        Call a readiness check until it returns a result, backing off between calls.
+        
+        No wait follows the last check allowed by max_retries. With a timeout,
+        the last wait ends at the deadline and is followed by one final check.
+        
+        Args:
+            check: Called with the zero-based attempt number. Returns the result,
+                or None while not ready together with the number of seconds the
+                server asked to wait, if any.
+            max_retries: Maximum number of checks. Ignored when a timeout is given.
+            retry_delay: Initial delay between checks in seconds.
+            max_delay: Upper bound for the delay between checks in seconds.
+            jitter: Maximum random delay in seconds added to each wait.
+            timeout: Optional wall-clock budget in seconds.
+            
+        Returns:
+            The result of the first successful check.
+            
+        Raises:
+            TimeoutError: If max_retries or timeout is reached.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        attempt = 0
+        while True:
+            result, retry_after = check(attempt)
+            if result is not None:
+                return result
+            attempt += 1
+            
+            # Give up right away rather than waiting for a check that will not happen
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                logger.error("Processing timed out after %s seconds", timeout)
+                raise TimeoutError(f"Processing timed out after {timeout} seconds")
+            if remaining is None and attempt >= max_retries:
+                logger.error("Processing timed out after %s retries", max_retries)
+                raise TimeoutError(f"Processing timed out after {max_retries} retries")
+            
+            # Still processing, wait and retry. A delay suggested by the server
+            # takes precedence over our own backoff.
+            if retry_after is not None:
+                delay = min(retry_after, max_delay)
+            else:
+                delay = _backoff_delay(attempt - 1, retry_delay, max_delay, jitter)
+            if remaining is not None:
+                delay = min(delay, remaining)
+            logger.debug("Results not ready, waiting %.2f seconds before retry", delay)
+            time.sleep(delay)
+    
     def process_file(
         self, 
         file_path: str, 
-        options: Optional[Dict[str, Any]] = None,
+        options: Optional[Options] = None,
         wait: bool = True,
         max_retries: int = 10,
-        retry_delay: int = 2
+        retry_delay: float = 2,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        timeout: Optional[float] = None
     ) -> str:
         """
         Process a file through the Data Curation API and retrieve the results.
@@ -286,8 +711,13 @@ class DataCurationClient:
                   "json_schema": false
                 }
             wait: Whether to wait for processing to complete.
-            max_retries: Maximum number of retries when waiting for results.
-            retry_delay: Delay between retries in seconds.
+            max_retries: Maximum number of readiness checks when waiting for results.
+                Ignored when a timeout is given.
+            retry_delay: Initial delay between readiness checks in seconds. The delay
+                doubles after each check, up to max_delay.
+            max_delay: Upper bound for the delay between readiness checks in seconds.
+            jitter: Maximum random delay in seconds added to each wait.
+            timeout: Optional wall-clock budget in seconds for waiting on results.
             
         Returns:
             The curated text. If json_schema is set to True in options, returns a JSON string.
@@ -296,55 +726,192 @@ class DataCurationClient:
             FileNotFoundError: If the file does not exist.
             ValueError: If the API token is missing.
             requests.RequestException: If the API request fails.
-            TimeoutError: If max_retries is reached while waiting for results.
+            TimeoutError: If max_retries or timeout is reached while waiting for results.
         """
-        logger.info(f"Processing file: {file_path}")
-        logger.info(f"Options: {options}")
-        logger.info(f"Wait for completion: {wait}")
+        logger.info("Processing file: %s", file_path)
+        logger.info("Options: %r", options)
+        logger.info("Wait for completion: %s", wait)
         
         # Upload the file and get URLs
         presign_data = self.upload_file(file_path, options)
-        job_id = presign_data['job_id']
         
         if not wait:
             logger.info("Not waiting for results, returning presign data")
-            return json.dumps(presign_data)
-        
-        # Wait for processing to complete
-        retries = 0
-        while retries < max_retries:
-            try:
-                # Check job status
-                logger.info(f"Checking job status (attempt {retries+1}/{max_retries})")
-                status_data = self.check_status(job_id)
-                logger.info(f"Job status: {status_data.get('status', 'unknown')}")
-                
-                if status_data.get('status') == 'Done':
-                    # Job is complete, get results
-                    logger.info(f"Job complete, retrieving results from: {presign_data['get_url']}")
-                    result = self.get_results(presign_data['get_url'])
-                    logger.info(f"Results retrieved, length: {len(result)} characters")
-                    return result
-                
-                # Job is still processing, wait and retry
-                logger.info(f"Job still processing, waiting {retry_delay} seconds before retry")
-                time.sleep(retry_delay)
-                retries += 1
-            except requests.HTTPError as e:
-                if e.response and e.response.status_code == 404:
-                    # Resource not ready yet, wait and retry
-                    logger.info(f"Resource not ready (404), waiting {retry_delay} seconds before retry")
-                    time.sleep(retry_delay)
-                    retries += 1
-                else:
-                    # Other HTTP error
-                    logger.error(f"HTTP error while checking status: {str(e)}")
-                    if hasattr(e, 'response') and e.response is not None:
-                        logger.error(f"Response content: {e.response.text}")
-                    raise
-            except Exception as e:
-                logger.error(f"Unexpected error while checking status: {str(e)}")
-                raise
-        
-        logger.error(f"Processing timed out after {max_retries} retries")
-        raise TimeoutError(f"Processing timed out after {max_retries} retries")
+            return _json_dumps(presign_data).decode("utf-8")
+        
+        # Wait for processing to complete by polling the result URL directly
+        response = self._wait_for_results(
+            presign_data['get_url'], max_retries, retry_delay, max_delay, jitter, timeout
+        )
+        result = str(response.text)
+        logger.info("Job complete, results length: %s characters", len(result))
+        return result
+    
+    def process_file_to(
+        self,
+        file_path: str,
+        output: BinaryIO,
+        options: Optional[Options] = None,
+        max_retries: int = 10,
+        retry_delay: float = 2,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        timeout: Optional[float] = None,
+        chunk_size: int = RESULTS_CHUNK_SIZE
+    ) -> int:
+        """
+        Process a file through the Data Curation API and stream the results to a file object.
+        
+        This works like process_file() with wait=True, but the results are written
+        to output as they are downloaded instead of being returned as a string, so
+        large results are never held in memory as a whole.
+        
+        Args:
+            file_path: Path to the file to process.
+            output: Binary file object the results are written to.
+            options: Optional processing options. See presign() method for detailed options documentation.
+            max_retries: Maximum number of readiness checks. Ignored when a timeout is given.
+            retry_delay: Initial delay between readiness checks in seconds.
+            max_delay: Upper bound for the delay between readiness checks in seconds.
+            jitter: Maximum random delay in seconds added to each wait.
+            timeout: Optional wall-clock budget in seconds for waiting on results.
+            chunk_size: Size in bytes of the chunks read from the results response.
+            
+        Returns:
+            The number of bytes written to output.
+            
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the API token is missing.
+            requests.RequestException: If the API request fails.
+            TimeoutError: If max_retries or timeout is reached while waiting for results.
+        """
+        logger.info("Processing file: %s", file_path)
+        logger.info("Options: %r", options)
+        
+        presign_data = self.upload_file(file_path, options)
+        
+        response = self._wait_for_results(
+            presign_data['get_url'], max_retries, retry_delay, max_delay, jitter, timeout, stream=True
+        )
+        with response:
+            return self._copy_results(response, output, chunk_size)
+    
+    def process_files(
+        self,
+        file_paths: List[str],
+        options: Optional[Options] = None,
+        max_workers: int = DEFAULT_BATCH_CONCURRENCY,
+        wait: bool = True,
+        max_retries: int = 10,
+        retry_delay: float = 2,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Process several files concurrently through the Data Curation API.
+        
+        All files are uploaded first, on a thread pool, so that the server works
+        on every job at the same time. The result URLs of all pending jobs are
+        then checked together on each polling round, until every result is
+        available. The threads share this client's pooled connections and
+        access token.
+        
+        Args:
+            file_paths: Paths to the files to process.
+            options: Optional processing options used for every file. See presign() method
+                for detailed options documentation.
+            max_workers: Maximum number of concurrent uploads and result requests.
+            wait: Whether to wait for processing to complete.
+            max_retries: Maximum number of polling rounds. Ignored when a timeout is given.
+            retry_delay: Initial delay between polling rounds in seconds.
+            max_delay: Upper bound for the delay between polling rounds in seconds.
+            jitter: Maximum random delay in seconds added to each wait.
+            timeout: Optional wall-clock budget in seconds for waiting on results.
+            
+        Returns:
+            The results, in the same order as file_paths. When wait is False, the
+            presign data of each job as a JSON string.
+            
+        Raises:
+            FileNotFoundError: If a file does not exist.
+            ValueError: If the API token is missing.
+            requests.RequestException: If an API request fails.
+            TimeoutError: If max_retries or timeout is reached while waiting for results.
+        """
+        logger.info("Processing %s files with %s workers", len(file_paths), max_workers)
+        
+        # Encode the options once for all files
+        body = encode_options(options) if options is not None else None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            presign_data = list(executor.map(lambda path: self.upload_file(path, body), file_paths))
+            
+            if not wait:
+                return [_json_dumps(data).decode("utf-8") for data in presign_data]
+            
+            return self._wait_for_all_results(
+                executor,
+                [data['get_url'] for data in presign_data],
+                max_retries, retry_delay, max_delay, jitter, timeout
+            )
+    
+    def _wait_for_all_results(
+        self,
+        executor: ThreadPoolExecutor,
+        get_urls: List[str],
+        max_retries: int,
+        retry_delay: float,
+        max_delay: float,
+        jitter: float,
+        timeout: Optional[float]
+    ) -> List[str]:
+        """
+        Poll several result URLs in rounds until all results are available.
+        
+        Each round checks every pending URL once, concurrently, then waits
+        before the next round.
+        
+        Args:
+            executor: Thread pool used for the result requests.
+            get_urls: URLs to retrieve the results from.
+            max_retries: Maximum number of polling rounds. Ignored when a timeout is given.
+            retry_delay: Initial delay between rounds in seconds.
+            max_delay: Upper bound for the delay between rounds in seconds.
+            jitter: Maximum random delay in seconds added to each wait.
+            timeout: Optional wall-clock budget in seconds.
+            
+        Returns:
+            The results, in the same order as get_urls.
+            
+        Raises:
+            requests.RequestException: If an API request fails.
+            TimeoutError: If max_retries or timeout is reached.
+        """
+        results: List[Optional[str]] = [None] * len(get_urls)
+        pending = list(range(len(get_urls)))
+        
+        def check(attempt: int) -> Tuple[Optional[List[str]], Optional[float]]:
+            nonlocal pending
+            logger.debug("Checking for %s results (round %s)", len(pending), attempt + 1)
+            futures = {index: executor.submit(self._get_results_if_ready, get_urls[index]) for index in pending}
+            retry_afters = []
+            for index, future in futures.items():
+                response, retry_after = future.result()
+                if response is not None:
+                    results[index] = str(response.text)
+                elif retry_after is not None:
+                    retry_afters.append(retry_after)
+            
+            pending = [index for index in pending if results[index] is None]
+            if not pending:
+                logger.info("All %s jobs complete", len(get_urls))
+                return [result for result in results if result is not None], None
+            
+            # When every pending job sent a Retry-After delay, the shortest one
+            # replaces our own backoff
+            logger.debug("%s jobs not ready", len(pending))
+            return None, min(retry_afters) if len(retry_afters) == len(pending) else None
+        
+        return self._poll(check, max_retries, retry_delay, max_delay, jitter, timeout)
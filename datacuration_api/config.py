@@ -6,13 +6,14 @@ from environment variables, .env files, and command-line arguments.
 """
 
 import os
+import json
+import time
 import logging
+import functools
 from typing import Dict, Optional, Any
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+# Set up logging; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 # Default API endpoints
@@ -21,19 +22,56 @@ DEFAULT_PRESIGN_ENDPOINT = f"{DEFAULT_API_BASE_URL}/presign"
 DEFAULT_STATUS_ENDPOINT = f"{DEFAULT_API_BASE_URL}/status"
 DEFAULT_AUTH_ENDPOINT = "https://auth.hyland.com/connect/token"
 
+# Refresh access tokens this many seconds before they actually expire
+TOKEN_REFRESH_SKEW = 60
+
+# Environment variables read by Config
+ENV_VARS = (
+    "DATA_CURATION_API_URL",
+    "DATA_CURATION_PRESIGN_ENDPOINT",
+    "DATA_CURATION_STATUS_ENDPOINT",
+    "DATA_CURATION_AUTH_ENDPOINT",
+    "DATA_CURATION_CLIENT_ID",
+    "DATA_CURATION_CLIENT_SECRET",
+    "DATA_CURATION_TOKEN_CACHE",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dotenv() -> None:
+    """
+    Load environment variables from a .env file, at most once per process.
+    
+    The file is not read at all when every variable used by Config is already
+    set, since existing environment variables take precedence over it anyway.
+    """
+    if all(os.environ.get(name) for name in ENV_VARS):
+        logger.debug("All configuration variables set, skipping .env file")
+        return
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        logger.debug("python-dotenv not available, skipping .env file")
+    else:
+        load_dotenv()
+
+
 class Config:
     """Configuration manager for the Data Curation API client."""
     
     def __init__(self) -> None:
         """Initialize the configuration with default values."""
         # Load environment variables from .env file if it exists
-        load_dotenv()
+        _load_dotenv()
         
         # Get environment variables and strip any whitespace/newlines
         self.api_base_url: str = os.getenv("DATA_CURATION_API_URL", DEFAULT_API_BASE_URL).strip()
-        self.presign_endpoint: str = os.getenv("DATA_CURATION_PRESIGN_ENDPOINT", DEFAULT_PRESIGN_ENDPOINT).strip()
-        self.status_endpoint: str = os.getenv("DATA_CURATION_STATUS_ENDPOINT", DEFAULT_STATUS_ENDPOINT).strip()
+        # Endpoints not set on their own follow the API base URL
+        self.presign_endpoint: str = os.getenv("DATA_CURATION_PRESIGN_ENDPOINT", f"{self.api_base_url}/presign").strip()
+        self.status_endpoint: str = os.getenv("DATA_CURATION_STATUS_ENDPOINT", f"{self.api_base_url}/status").strip()
         self.auth_endpoint: str = os.getenv("DATA_CURATION_AUTH_ENDPOINT", DEFAULT_AUTH_ENDPOINT).strip()
+        self._status_url_fmt: str = self.status_endpoint + "/{}"
         self.client_id: Optional[str] = os.getenv("DATA_CURATION_CLIENT_ID")
         if self.client_id:
             self.client_id = self.client_id.strip()
@@ -42,38 +80,67 @@ class Config:
             self.client_secret = self.client_secret.strip()
         self.access_token: Optional[str] = None
         self.token_expiry: Optional[int] = None
+        self.token_expires_at: float = 0.0
+        self._auth_headers: Optional[Dict[str, str]] = None
+        self._auth_headers_token: Optional[str] = None
+        self._token_request_data: Optional[Dict[str, str]] = None
+        self.token_cache_path: Optional[str] = os.getenv("DATA_CURATION_TOKEN_CACHE")
         
-        # Log configuration (masking sensitive values)
-        logger.info("Configuration initialized:")
-        logger.info(f"API Base URL: {self.api_base_url}")
-        logger.info(f"Presign Endpoint: {self.presign_endpoint}")
-        logger.info(f"Status Endpoint: {self.status_endpoint}")
-        logger.info(f"Auth Endpoint: {self.auth_endpoint}")
-        logger.info(f"Client ID: {'*' * 5 if self.client_id else 'not set'}")
-        logger.info(f"Client Secret: {'*' * 5 if self.client_secret else 'not set'}")
-        
-        # Log the length of each value to help debug any trailing whitespace issues
-        logger.info(f"API Base URL length: {len(self.api_base_url)}")
-        logger.info(f"Auth Endpoint length: {len(self.auth_endpoint)}")
-        if self.client_id:
-            logger.info(f"Client ID length: {len(self.client_id)}")
-        if self.client_secret:
-            logger.info(f"Client Secret length: {len(self.client_secret)}")
+        # Log configuration (masking sensitive values). The global instance is
+        # created on import, so skip this entirely unless INFO logging is enabled.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Configuration initialized:")
+            logger.info("API Base URL: %s", self.api_base_url)
+            logger.info("Presign Endpoint: %s", self.presign_endpoint)
+            logger.info("Status Endpoint: %s", self.status_endpoint)
+            logger.info("Auth Endpoint: %s", self.auth_endpoint)
+            logger.info("Client ID: %s", '*' * 5 if self.client_id else 'not set')
+            logger.info("Client Secret: %s", '*' * 5 if self.client_secret else 'not set')
+            
+            # Log the length of each value to help debug any trailing whitespace issues
+            logger.info("API Base URL length: %s", len(self.api_base_url))
+            logger.info("Auth Endpoint length: %s", len(self.auth_endpoint))
+            if self.client_id:
+                logger.info("Client ID length: %s", len(self.client_id))
+            if self.client_secret:
+                logger.info("Client Secret length: %s", len(self.client_secret))
     
     def update(self, **kwargs: Any) -> None:
         """
         Update configuration with provided values.
         
+        Values equal to the current ones are skipped, so applying the same
+        settings again, as repeated in-process CLI runs do, changes nothing.
+        
         Args:
             **kwargs: Configuration key-value pairs to update.
         """
+        updated = []
         for key, value in kwargs.items():
             if hasattr(self, key) and value is not None:
                 # Strip whitespace from string values
                 if isinstance(value, str):
                     value = value.strip()
-                logger.info(f"Updating config: {key} = {'*' * 5 if key in ['client_id', 'client_secret', 'access_token'] else value}")
+                if getattr(self, key) == value:
+                    continue
+                logger.info("Updating config: %s = %s", key, '*' * 5 if key in ['client_id', 'client_secret', 'access_token'] else value)
                 setattr(self, key, value)
+                updated.append(key)
+        
+        if "status_endpoint" in updated:
+            self._status_url_fmt = self.status_endpoint + "/{}"
+    
+    def get_status_url(self, job_id: str) -> str:
+        """
+        Get the status URL for a job.
+        
+        Args:
+            job_id: The job ID.
+            
+        Returns:
+            str: The status endpoint URL for the job.
+        """
+        return self._status_url_fmt.format(job_id)
     
     def validate(self) -> None:
         """
@@ -101,10 +168,99 @@ class Config:
         
         logger.info("Configuration validation successful")
     
+    def set_access_token(self, access_token: str, expires_in: int) -> None:
+        """
+        Store an access token together with its expiry deadline.
+        
+        Args:
+            access_token: The access token returned by the auth endpoint.
+            expires_in: Lifetime of the token in seconds.
+        """
+        self.access_token = access_token
+        self.token_expiry = expires_in
+        self.token_expires_at = time.monotonic() + expires_in - TOKEN_REFRESH_SKEW
+        
+        if self.token_cache_path:
+            self._save_cached_token(access_token, time.time() + expires_in)
+    
+    def load_cached_token(self) -> bool:
+        """
+        Load a still valid access token from the token cache file, if enabled.
+        
+        Only tokens issued for the current client ID and auth endpoint are used.
+        
+        Returns:
+            bool: True if a valid token was loaded.
+        """
+        if not self.token_cache_path:
+            return False
+        
+        try:
+            with open(Path(self.token_cache_path).expanduser(), "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if not isinstance(cached, dict) or (
+            cached.get("client_id") != self.client_id
+            or cached.get("auth_endpoint") != self.auth_endpoint
+        ):
+            return False
+        
+        try:
+            remaining = float(cached.get("expires_at", 0)) - time.time()
+        except (TypeError, ValueError):
+            return False
+        if remaining <= TOKEN_REFRESH_SKEW or not cached.get("access_token"):
+            return False
+        
+        logger.info("Using cached access token")
+        self.access_token = cached["access_token"]
+        self.token_expiry = int(remaining)
+        self.token_expires_at = time.monotonic() + remaining - TOKEN_REFRESH_SKEW
+        return True
+    
+    def _save_cached_token(self, access_token: str, expires_at: float) -> None:
+        """
+        Write an access token to the token cache file, readable only by the user.
+        
+        Args:
+            access_token: The access token.
+            expires_at: Expiry time of the token as a Unix timestamp.
+        """
+        assert self.token_cache_path is not None
+        cache_path = Path(self.token_cache_path).expanduser()
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "client_id": self.client_id,
+                    "auth_endpoint": self.auth_endpoint,
+                    "access_token": access_token,
+                    "expires_at": expires_at,
+                }, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write token cache %s: %s", cache_path, e)
+    
+    def token_valid(self) -> bool:
+        """
+        Check whether the current access token can still be used.
+        
+        Returns:
+            bool: True if a token is set and is not about to expire.
+        """
+        return bool(self.access_token) and time.monotonic() < self.token_expires_at
+    
     def get_auth_headers(self) -> Dict[str, str]:
         """
         Get HTTP headers for API requests with Bearer token authentication.
         
+        The same dictionary is returned until the access token changes, so
+        callers must not modify it.
+        
         Returns:
             Dict[str, str]: Headers including authorization and content type.
         """
@@ -112,23 +268,39 @@ class Config:
             logger.error("No access token available. Call authenticate() first.")
             raise ValueError("No access token available. Call authenticate() first.")
         
-        logger.debug("Creating auth headers with access token")
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-            "Accept": "text/json",
-        }
+        # Reuse the headers built for the current token; they only change on refresh
+        if self._auth_headers is None or self._auth_headers_token != self.access_token:
+            logger.debug("Creating auth headers with access token")
+            self._auth_headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+                "Accept": "text/json",
+            }
+            self._auth_headers_token = self.access_token
+        return self._auth_headers
     
     def get_token_request_data(self) -> Dict[str, str]:
         """
         Get the request data for token authentication.
         
+        The same dictionary is returned until the credentials change, so callers
+        must not modify it.
+        
         Returns:
             Dict[str, str]: Form data for token request.
             
         Raises:
             ValueError: If client_id or client_secret is not set.
         """
+        # Reuse the data built for the current credentials
+        cached = self._token_request_data
+        if (
+            cached is not None
+            and cached["client_id"] == self.client_id
+            and cached["client_secret"] == self.client_secret
+        ):
+            return cached
+        
         logger.debug("Preparing token request data")
         
         missing = []
@@ -148,12 +320,13 @@ class Config:
         assert self.client_secret is not None
         
         logger.debug("Token request data prepared successfully")
-        return {
+        self._token_request_data = {
             "grant_type": "client_credentials",
             "scope": "environment_authorization",
             "client_id": self.client_id,
             "client_secret": self.client_secret
         }
+        return self._token_request_data
 
 
 # Global configuration instance
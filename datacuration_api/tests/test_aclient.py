@@ -0,0 +1,61 @@
+"""
+Tests for the asynchronous Data Curation API client.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+from typing import List
+
+from datacuration_api.aclient import AsyncDataCurationClient
+
+
+def test_process_file() -> None:
+    """Test that process_file runs the synchronous client off the event loop."""
+    client = MagicMock()
+    loop_thread = threading.get_ident()
+    
+    def process_file(file_path: str, options: dict, **kwargs: int) -> str:
+        assert threading.get_ident() != loop_thread
+        return f"Curated {file_path}"
+    
+    client.process_file.side_effect = process_file
+    
+    async def run() -> str:
+        async with AsyncDataCurationClient(client=client) as async_client:
+            return await async_client.process_file("a.pdf", {"chunking": True}, max_retries=3)
+    
+    assert asyncio.run(run()) == "Curated a.pdf"
+    client.process_file.assert_called_once_with("a.pdf", {"chunking": True}, max_retries=3)
+    # The wrapped client was passed in, so it is left open
+    client.close.assert_not_called()
+
+
+def test_close_owned_client() -> None:
+    """Test that close() closes a client the async client created itself."""
+    with patch("datacuration_api.aclient.DataCurationClient") as mock_client_class:
+        async_client = AsyncDataCurationClient("test_client_id", "test_client_secret")
+        asyncio.run(async_client.close())
+    
+    mock_client_class.assert_called_once_with("test_client_id", "test_client_secret")
+    mock_client_class.return_value.close.assert_called_once()
+
+
+def test_process_many() -> None:
+    """Test that process_many processes every file and keeps the input order."""
+    client = MagicMock()
+    client.process_file.side_effect = lambda file_path, options: f"Curated {file_path}"
+    
+    async def run() -> List[str]:
+        async_client = AsyncDataCurationClient(client=client)
+        return await async_client.process_many(["a.pdf", "b.pdf", "c.pdf"], concurrency=2)
+    
+    assert asyncio.run(run()) == ["Curated a.pdf", "Curated b.pdf", "Curated c.pdf"]
+    assert client.process_file.call_count == 3
+
+
+def test_package_export() -> None:
+    """Test that the package exports the async client on first use."""
+    import datacuration_api
+    
+    assert datacuration_api.AsyncDataCurationClient is AsyncDataCurationClient
@@ -2,15 +2,29 @@
 Tests for the Data Curation API client.
 """
 
+import io
 import os
 import json
+import logging
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 from pathlib import Path
-from typing import Generator
+from typing import Any, Dict, Generator, Optional, Tuple
 
-from datacuration_api.client import DataCurationClient
-from datacuration_api.config import config
+import requests
+from requests.adapters import HTTPAdapter
+
+from datacuration_api.client import (
+    DataCurationClient,
+    DEFAULT_TIMEOUT,
+    MIN_UPLOAD_RATE,
+    SEND_BLOCKSIZE,
+    URLLIB3_HAS_BLOCKSIZE,
+    _create_session,
+    decode_options,
+    encode_options,
+)
+from datacuration_api.config import config, Config, _load_dotenv
 
 
 @pytest.fixture
@@ -23,6 +37,9 @@ def mock_config() -> Generator[MagicMock, None, None]:
         mock_config.client_id = "test_client_id"
         mock_config.client_secret = "test_client_secret"
         mock_config.access_token = "test_access_token"
+        mock_config.token_valid.return_value = True
+        mock_config.load_cached_token.return_value = False
+        mock_config.get_status_url.side_effect = lambda job_id: f"{mock_config.status_endpoint}/{job_id}"
         mock_config.get_token_request_data.return_value = {
             "grant_type": "client_credentials",
             "scope": "environment_authorization",
@@ -37,24 +54,37 @@ def mock_config() -> Generator[MagicMock, None, None]:
         yield mock_config
 
 
+@pytest.fixture(scope="module")
+def http_session() -> Generator[requests.Session, None, None]:
+    """Fixture to create one pooled HTTP session shared by the tests in this module."""
+    session = _create_session()
+    yield session
+    session.close()
+
+
 @pytest.fixture
-def api_client(mock_config: MagicMock) -> DataCurationClient:
+def api_client(mock_config: MagicMock, http_session: requests.Session) -> Generator[DataCurationClient, None, None]:
     """Fixture to create an API client with mock configuration."""
-    return DataCurationClient(client_id="test_client_id", client_secret="test_client_secret")
+    with DataCurationClient(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        session=http_session
+    ) as client:
+        yield client
 
 
 def test_authenticate(api_client: DataCurationClient, mock_config: MagicMock) -> None:
     """Test the authenticate method."""
-    with patch("requests.post") as mock_post:
+    with patch.object(api_client._session, "request") as mock_request:
         # Set up the mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "access_token": "test_access_token",
             "expires_in": 900,
             "token_type": "Bearer",
             "scope": "environment_authorization"
-        }
-        mock_post.return_value = mock_response
+        }).encode("utf-8")
+        mock_request.return_value = mock_response
         
         # Call the method
         result = api_client.authenticate()
@@ -66,29 +96,30 @@ def test_authenticate(api_client: DataCurationClient, mock_config: MagicMock) ->
         mock_config.validate.assert_called_once()
         
         # Verify the token request was made correctly
-        mock_post.assert_called_once_with(
+        mock_request.assert_called_once_with(
+            "POST",
             mock_config.auth_endpoint,
             data=mock_config.get_token_request_data(),
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=DEFAULT_TIMEOUT
         )
         
-        # Verify the access token was stored
-        assert mock_config.access_token == "test_access_token"
-        assert mock_config.token_expiry == 900
+        # Verify the access token was stored with its lifetime
+        mock_config.set_access_token.assert_called_once_with("test_access_token", 900)
 
 
 def test_presign(api_client: DataCurationClient, mock_config: MagicMock) -> None:
     """Test the presign method."""
-    with patch("requests.post") as mock_post, \
+    with patch.object(api_client._session, "request") as mock_request, \
          patch("datacuration_api.client.DataCurationClient.authenticate") as mock_auth:
         # Set up the mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "job_id": "test-job-id",
             "put_url": "https://test-s3.example.com/upload",
             "get_url": "https://test-s3.example.com/results",
-        }
-        mock_post.return_value = mock_response
+        }).encode("utf-8")
+        mock_request.return_value = mock_response
         
         # Call the method
         result = api_client.presign()
@@ -99,29 +130,31 @@ def test_presign(api_client: DataCurationClient, mock_config: MagicMock) -> None
         assert result["get_url"] == "https://test-s3.example.com/results"
         
         # Verify the request
-        mock_post.assert_called_once_with(
+        mock_request.assert_called_once_with(
+            "POST",
             mock_config.presign_endpoint,
             headers=mock_config.get_auth_headers(),
-            json={}
+            data=b"{}",
+            timeout=DEFAULT_TIMEOUT
         )
         
-        # Verify authentication was called when no access token is available
-        mock_config.access_token = None
+        # Verify authentication was called when no valid access token is available
+        mock_config.token_valid.return_value = False
         api_client.presign()
         mock_auth.assert_called_once()
 
 
 def test_presign_with_options(api_client: DataCurationClient, mock_config: MagicMock) -> None:
     """Test the presign method with options."""
-    with patch("requests.post") as mock_post:
+    with patch.object(api_client._session, "request") as mock_request:
         # Set up the mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "job_id": "test-job-id",
             "put_url": "https://test-s3.example.com/upload",
             "get_url": "https://test-s3.example.com/results",
-        }
-        mock_post.return_value = mock_response
+        }).encode("utf-8")
+        mock_request.return_value = mock_response
         
         # Call the method with options
         options = {
@@ -132,19 +165,46 @@ def test_presign_with_options(api_client: DataCurationClient, mock_config: Magic
         result = api_client.presign(options)
         
         # Verify the request includes the options
-        mock_post.assert_called_once_with(
+        mock_request.assert_called_once_with(
+            "POST",
             mock_config.presign_endpoint,
             headers=mock_config.get_auth_headers(),
-            json=options
+            data=ANY,
+            timeout=DEFAULT_TIMEOUT
         )
+        assert json.loads(mock_request.call_args.kwargs["data"]) == options
+
+
+def test_presign_with_encoded_options(api_client: DataCurationClient, mock_config: MagicMock) -> None:
+    """Test that pre-encoded options are sent without re-encoding."""
+    with patch.object(api_client._session, "request") as mock_request:
+        mock_request.return_value.content = b'{"job_id": "test-job-id"}'
+        
+        api_client.presign('{"chunking": true}')
+        
+        mock_request.assert_called_once_with(
+            "POST",
+            mock_config.presign_endpoint,
+            headers=mock_config.get_auth_headers(),
+            data=b'{"chunking": true}',
+            timeout=DEFAULT_TIMEOUT
+        )
+
+
+def test_encode_decode_options() -> None:
+    """Test that the public options helpers round-trip and reject invalid JSON."""
+    options = {"chunking": True, "normalization": {"dashes": False}}
+    assert decode_options(encode_options(options)) == options
+    assert encode_options('{"chunking": true}') == b'{"chunking": true}'
+    
+    with pytest.raises(ValueError):
+        decode_options("{invalid json")
 
 
 def test_upload_file(api_client: DataCurationClient) -> None:
     """Test the upload_file method."""
     with patch("datacuration_api.client.DataCurationClient.presign") as mock_presign, \
-         patch("builtins.open", MagicMock()), \
-         patch("requests.put") as mock_put, \
-         patch("pathlib.Path.exists", return_value=True):
+         patch.object(api_client._session, "request") as mock_request:
         
         # Set up the mock presign response
         mock_presign.return_value = {
@@ -156,14 +216,14 @@ def test_upload_file(api_client: DataCurationClient) -> None:
         # Set up the mock file content
         mock_file_content = b"test file content"
         mock_file = MagicMock()
-        mock_file.__enter__.return_value.read.return_value = mock_file_content
+        mock_file.__enter__.return_value = mock_file
         
-        # Mock the Path.stat method to return a mock stat result with a size
+        # Mock os.stat to return a mock stat result with a size
         mock_stat_result = MagicMock()
         mock_stat_result.st_size = len(mock_file_content)
         
         with patch("builtins.open", return_value=mock_file), \
-             patch("pathlib.Path.stat", return_value=mock_stat_result):
+             patch("datacuration_api.client.os.stat", return_value=mock_stat_result):
             # Call the method
             result = api_client.upload_file("test_file.txt")
             
@@ -173,23 +233,66 @@ def test_upload_file(api_client: DataCurationClient) -> None:
             assert result["get_url"] == "https://test-s3.example.com/results"
             
             # Verify the put request was made with correct headers
-            mock_put.assert_called_once_with(
+            mock_request.assert_called_once_with(
+                "PUT",
                 "https://test-s3.example.com/upload",
-                data=mock_file_content,
+                data=mock_file,
                 headers={
                     "Content-Type": "application/octet-stream",
                     "Content-Length": str(len(mock_file_content))
-                }
+                },
+                timeout=DEFAULT_TIMEOUT
             )
 
 
+def test_upload_file_streams_from_disk(api_client: DataCurationClient, tmp_path: Path) -> None:
+    """Test that upload_file streams the open file instead of reading it into memory."""
+    test_file = tmp_path / "test_file.bin"
+    test_file.write_bytes(b"x" * 100_000)
+    
+    with patch("datacuration_api.client.DataCurationClient.presign") as mock_presign, \
+         patch.object(api_client._session, "request") as mock_request:
+        
+        mock_presign.return_value = {
+            "job_id": "test-job-id",
+            "put_url": "https://test-s3.example.com/upload",
+            "get_url": "https://test-s3.example.com/results",
+        }
+        
+        def request(method: str, url: str, data: io.BufferedReader, headers: Dict[str, str], timeout: Tuple[float, float]) -> MagicMock:
+            # The body is the file object, still positioned at the start
+            assert data.name == str(test_file)
+            assert data.tell() == 0
+            return MagicMock()
+        
+        mock_request.side_effect = request
+        
+        api_client.upload_file(str(test_file))
+        
+        assert mock_request.call_args.kwargs["headers"]["Content-Length"] == "100000"
+
+
+def test_upload_timeout_scales_with_size(api_client: DataCurationClient) -> None:
+    """Test that upload read timeouts grow with the body size."""
+    assert api_client._upload_timeout(1024) == DEFAULT_TIMEOUT
+    assert api_client._upload_timeout(100 * MIN_UPLOAD_RATE) == (DEFAULT_TIMEOUT[0], 100.0)
+
+
+def test_upload_file_not_found(api_client: DataCurationClient, tmp_path: Path) -> None:
+    """Test that uploading a missing file fails before calling the API."""
+    with patch("datacuration_api.client.DataCurationClient.presign") as mock_presign:
+        with pytest.raises(FileNotFoundError):
+            api_client.upload_file(str(tmp_path / "missing.pdf"))
+        mock_presign.assert_not_called()
+
+
 def test_get_results(api_client: DataCurationClient) -> None:
     """Test the get_results method."""
-    with patch("requests.get") as mock_get:
+    with patch.object(api_client._session, "request") as mock_request:
         # Set up the mock response
         mock_response = MagicMock()
         mock_response.text = "Curated text content"
-        mock_get.return_value = mock_response
+        mock_request.return_value = mock_response
         
         # Call the method
         result = api_client.get_results("https://test-s3.example.com/results")
@@ -198,19 +301,19 @@ def test_get_results(api_client: DataCurationClient) -> None:
         assert result == "Curated text content"
         
         # Verify the request
-        mock_get.assert_called_once_with("https://test-s3.example.com/results")
+        mock_request.assert_called_once_with("GET", "https://test-s3.example.com/results", timeout=DEFAULT_TIMEOUT)
 
 
 def test_check_status(api_client: DataCurationClient, mock_config: MagicMock) -> None:
     """Test the check_status method."""
-    with patch("requests.get") as mock_get:
+    with patch.object(api_client._session, "request") as mock_request:
         # Set up the mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jobId": "test-job-id",
             "status": "Done"
-        }
-        mock_get.return_value = mock_response
+        }).encode("utf-8")
+        mock_request.return_value = mock_response
         
         # Call the method
         result = api_client.check_status("test-job-id")
@@ -220,17 +323,30 @@ def test_check_status(api_client: DataCurationClient, mock_config: MagicMock) ->
         assert result["status"] == "Done"
         
         # Verify the request
-        mock_get.assert_called_once_with(
+        mock_request.assert_called_once_with(
+            "GET",
             f"{mock_config.status_endpoint}/test-job-id",
-            headers=mock_config.get_auth_headers()
+            headers=mock_config.get_auth_headers(),
+            timeout=DEFAULT_TIMEOUT
         )
 
 
+def _results_response(status_code: int, text: str = "", headers: Optional[Dict[str, str]] = None) -> MagicMock:
+    """Build a mock response from the result URL."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status_code} Error")
+    return response
+
+
 def test_process_file(api_client: DataCurationClient) -> None:
     """Test the process_file method."""
     with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
          patch("datacuration_api.client.DataCurationClient.check_status") as mock_check_status, \
-         patch("datacuration_api.client.DataCurationClient.get_results") as mock_get_results:
+         patch.object(api_client._session, "get") as mock_get:
         
         # Set up the mock upload response
         mock_upload.return_value = {
@@ -239,14 +355,8 @@ def test_process_file(api_client: DataCurationClient) -> None:
             "get_url": "https://test-s3.example.com/results",
         }
         
-        # Set up the mock check_status response
-        mock_check_status.return_value = {
-            "jobId": "test-job-id",
-            "status": "Done"
-        }
-        
-        # Set up the mock get_results response
-        mock_get_results.return_value = "Curated text content"
+        # Set up the mock result URL response
+        mock_get.return_value = _results_response(200, "Curated text content")
         
         # Call the method
         result = api_client.process_file("test_file.txt")
@@ -254,7 +364,405 @@ def test_process_file(api_client: DataCurationClient) -> None:
         # Verify the result
         assert result == "Curated text content"
         
-        # Verify the method calls
+        # Verify the method calls; readiness is checked on the result URL only
         mock_upload.assert_called_once_with("test_file.txt", None)
-        mock_check_status.assert_called_once_with("test-job-id")
-        mock_get_results.assert_called_once_with("https://test-s3.example.com/results")
+        mock_get.assert_called_once_with("https://test-s3.example.com/results", stream=False, timeout=DEFAULT_TIMEOUT)
+        mock_check_status.assert_not_called()
+
+
+def test_get_results_stream(api_client: DataCurationClient) -> None:
+    """Test that get_results_stream copies the results to the sink in chunks."""
+    with patch.object(api_client._session, "request") as mock_request:
+        response = _results_response(200)
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"Curated ", b"text content"]
+        mock_request.return_value = response
+        
+        sink = io.BytesIO()
+        written = api_client.get_results_stream("https://test-s3.example.com/results", sink, chunk_size=8)
+        
+        assert written == len(b"Curated text content")
+        assert sink.getvalue() == b"Curated text content"
+        mock_request.assert_called_once_with("GET", "https://test-s3.example.com/results", stream=True, timeout=DEFAULT_TIMEOUT)
+        response.iter_content.assert_called_once_with(8)
+
+
+def test_process_file_to(api_client: DataCurationClient) -> None:
+    """Test that process_file_to streams the results once they are ready."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("time.sleep"):
+        
+        mock_upload.return_value = {
+            "job_id": "test-job-id",
+            "put_url": "https://test-s3.example.com/upload",
+            "get_url": "https://test-s3.example.com/results",
+        }
+        not_ready = _results_response(404)
+        ready = _results_response(200)
+        ready.__enter__.return_value = ready
+        ready.iter_content.return_value = [b"Curated text content"]
+        mock_get.side_effect = [not_ready, ready]
+        
+        sink = io.BytesIO()
+        written = api_client.process_file_to("test_file.txt", sink, jitter=0)
+        
+        assert written == len(b"Curated text content")
+        assert sink.getvalue() == b"Curated text content"
+        mock_get.assert_called_with("https://test-s3.example.com/results", stream=True, timeout=DEFAULT_TIMEOUT)
+        not_ready.close.assert_called_once()
+
+
+def test_session_retries_transient_errors(api_client: DataCurationClient) -> None:
+    """Test that the session retries transient errors on idempotent requests."""
+    adapter = api_client._session.get_adapter("https://test-api.example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    retry = adapter.max_retries
+    assert retry.total == 5
+    assert set(retry.status_forcelist) == {429, 502, 503, 504}
+    assert retry.allowed_methods == frozenset(["GET", "HEAD", "PUT", "POST"])
+    assert retry.respect_retry_after_header
+
+
+@pytest.mark.skipif(not URLLIB3_HAS_BLOCKSIZE, reason="urllib3 has no blocksize setting")
+def test_session_sends_large_blocks(api_client: DataCurationClient) -> None:
+    """Test that pooled connections send request bodies in large blocks."""
+    adapter = api_client._session.get_adapter("https://test-api.example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["blocksize"] == SEND_BLOCKSIZE
+
+
+def test_session_without_blocksize_support() -> None:
+    """Test that sessions still work with a urllib3 that has no blocksize setting."""
+    with patch("datacuration_api.client.URLLIB3_HAS_BLOCKSIZE", False):
+        session = _create_session()
+    
+    adapter = session.get_adapter("https://test-api.example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    assert "blocksize" not in adapter.poolmanager.connection_pool_kw
+    # urllib3 1.26 fails here when given a blocksize it does not know
+    adapter.poolmanager.connection_from_url("https://test-api.example.com")
+    session.close()
+
+
+def test_pool_size(mock_config: MagicMock) -> None:
+    """Test that the pool size bounds the connections kept open per host."""
+    with DataCurationClient(pool_size=32) as client:
+        adapter = client._session.get_adapter("https://test-api.example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+
+
+def test_process_files(api_client: DataCurationClient) -> None:
+    """Test that process_files uploads every file, then polls all jobs together."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("time.sleep") as mock_sleep:
+        
+        mock_upload.side_effect = lambda path, options, **kwargs: {
+            "job_id": f"job-{path}",
+            "put_url": f"https://test-s3.example.com/upload/{path}",
+            "get_url": f"https://test-s3.example.com/results/{path}",
+        }
+        
+        # b.pdf needs a second round; the other results are ready at once
+        rounds: Dict[str, int] = {}
+        
+        def get(url: str, **kwargs: Any) -> MagicMock:
+            rounds[url] = rounds.get(url, 0) + 1
+            if url.endswith("b.pdf") and rounds[url] == 1:
+                return _results_response(404)
+            return _results_response(200, f"Curated {url.rsplit('/', 1)[-1]}")
+        
+        mock_get.side_effect = get
+        
+        results = api_client.process_files(["a.pdf", "b.pdf", "c.pdf"], {"chunking": True}, jitter=0)
+        
+        assert results == ["Curated a.pdf", "Curated b.pdf", "Curated c.pdf"]
+        assert mock_upload.call_count == 3
+        assert rounds["https://test-s3.example.com/results/b.pdf"] == 2
+        mock_sleep.assert_called_once_with(2)
+        
+        # The options are encoded once and shared by every file
+        bodies = {id(call.args[1]) for call in mock_upload.call_args_list}
+        assert len(bodies) == 1
+        assert json.loads(mock_upload.call_args.args[1]) == {"chunking": True}
+
+
+def test_process_files_timeout(api_client: DataCurationClient) -> None:
+    """Test that process_files gives up after max_retries rounds without a final wait."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("datacuration_api.client.time.sleep") as mock_sleep:
+        
+        mock_upload.side_effect = lambda path, options, **kwargs: {
+            "job_id": f"job-{path}",
+            "get_url": f"https://test-s3.example.com/results/{path}",
+        }
+        mock_get.side_effect = lambda url, **kwargs: _results_response(404)
+        
+        with pytest.raises(TimeoutError):
+            api_client.process_files(["a.pdf", "b.pdf"], max_retries=2, jitter=0)
+        
+        assert mock_get.call_count == 4
+        assert mock_sleep.call_count == 1
+
+
+def test_process_files_no_wait(api_client: DataCurationClient) -> None:
+    """Test that process_files returns the job details without polling when not waiting."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get:
+        
+        mock_upload.side_effect = lambda path, options, **kwargs: {"job_id": f"job-{path}"}
+        
+        results = api_client.process_files(["a.pdf", "b.pdf"], wait=False)
+        
+        assert [json.loads(result) for result in results] == [{"job_id": "job-a.pdf"}, {"job_id": "job-b.pdf"}]
+        mock_get.assert_not_called()
+
+
+def test_context_manager_closes_session(mock_config: MagicMock) -> None:
+    """Test that leaving the context manager closes the HTTP session."""
+    client = DataCurationClient()
+    with patch.object(client._session, "close") as mock_close:
+        with client as entered:
+            assert entered is client
+        mock_close.assert_called_once()
+
+
+def test_injected_session(mock_config: MagicMock) -> None:
+    """Test that an injected session is used for requests and left open on close."""
+    session = MagicMock()
+    session.request.return_value.text = "Curated text content"
+    
+    with DataCurationClient(session=session) as client:
+        assert client.get_results("https://test-s3.example.com/results") == "Curated text content"
+    
+    session.request.assert_called_once_with("GET", "https://test-s3.example.com/results", timeout=DEFAULT_TIMEOUT)
+    session.close.assert_not_called()
+
+
+def test_process_file_backoff(api_client: DataCurationClient) -> None:
+    """Test that process_file backs off exponentially while the job is running."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("datacuration_api.client.time.sleep") as mock_sleep:
+        
+        mock_upload.return_value = {
+            "job_id": "test-job-id",
+            "put_url": "https://test-s3.example.com/upload",
+            "get_url": "https://test-s3.example.com/results",
+        }
+        mock_get.side_effect = [
+            _results_response(404),
+            _results_response(403),
+            _results_response(404),
+            _results_response(404),
+            _results_response(200, "Curated text content"),
+        ]
+        
+        result = api_client.process_file("test_file.txt", retry_delay=1, max_delay=3, jitter=0)
+        
+        assert result == "Curated text content"
+        # The delay doubles after each check and is capped
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [1, 2, 3, 3]
+
+
+def test_process_file_retry_after(api_client: DataCurationClient) -> None:
+    """Test that process_file waits as long as the server asks through Retry-After."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("datacuration_api.client.time.sleep") as mock_sleep:
+        
+        mock_upload.return_value = {
+            "job_id": "test-job-id",
+            "put_url": "https://test-s3.example.com/upload",
+            "get_url": "https://test-s3.example.com/results",
+        }
+        mock_get.side_effect = [
+            _results_response(404, headers={"Retry-After": "7"}),
+            _results_response(404, headers={"Retry-After": "120"}),
+            _results_response(200, "Curated text content"),
+        ]
+        
+        result = api_client.process_file("test_file.txt", retry_delay=1, max_delay=30, jitter=0)
+        
+        assert result == "Curated text content"
+        # Server hints replace the backoff delay but are still capped
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [7, 30]
+
+
+def test_process_file_error(api_client: DataCurationClient) -> None:
+    """Test that process_file raises errors other than the result not being ready."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("datacuration_api.client.time.sleep"):
+        
+        mock_upload.return_value = {
+            "job_id": "test-job-id",
+            "put_url": "https://test-s3.example.com/upload",
+            "get_url": "https://test-s3.example.com/results",
+        }
+        mock_get.return_value = _results_response(500)
+        
+        with pytest.raises(requests.HTTPError):
+            api_client.process_file("test_file.txt")
+
+
+def test_process_file_timeout(api_client: DataCurationClient) -> None:
+    """Test that process_file gives up once max_retries is reached."""
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("datacuration_api.client.time.sleep") as mock_sleep:
+        
+        mock_upload.return_value = {
+            "job_id": "test-job-id",
+            "put_url": "https://test-s3.example.com/upload",
+            "get_url": "https://test-s3.example.com/results",
+        }
+        mock_get.return_value = _results_response(404)
+        
+        with pytest.raises(TimeoutError):
+            api_client.process_file("test_file.txt", max_retries=3)
+        
+        # No wait follows the last check
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+
+
+def test_process_file_deadline(api_client: DataCurationClient) -> None:
+    """Test that process_file checks once more when its wait reaches the deadline."""
+    clock = [0.0]
+    
+    def sleep(delay: float) -> None:
+        clock[0] += delay
+    
+    with patch("datacuration_api.client.DataCurationClient.upload_file") as mock_upload, \
+         patch.object(api_client._session, "get") as mock_get, \
+         patch("datacuration_api.client.time.monotonic", side_effect=lambda: clock[0]), \
+         patch("datacuration_api.client.time.sleep", side_effect=sleep) as mock_sleep:
+        
+        mock_upload.return_value = {
+            "job_id": "test-job-id",
+            "put_url": "https://test-s3.example.com/upload",
+            "get_url": "https://test-s3.example.com/results",
+        }
+        mock_get.side_effect = [
+            _results_response(404),
+            _results_response(404),
+            _results_response(200, "Curated text content"),
+        ]
+        
+        result = api_client.process_file("test_file.txt", retry_delay=2, jitter=0, timeout=5)
+        
+        # The second wait is cut to the deadline, then the job is found done
+        assert result == "Curated text content"
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 3]
+
+
+def test_token_valid() -> None:
+    """Test that tokens are considered expired ahead of their deadline."""
+    test_config = Config()
+    assert not test_config.token_valid()
+    
+    test_config.set_access_token("test_access_token", 900)
+    assert test_config.token_valid()
+    
+    # Tokens within the refresh skew of their expiry are refreshed early
+    test_config.set_access_token("test_access_token", 30)
+    assert not test_config.token_valid()
+
+
+def test_auth_headers_cached_per_token() -> None:
+    """Test that auth headers are reused until the access token changes."""
+    test_config = Config()
+    test_config.set_access_token("first_token", 900)
+    headers = test_config.get_auth_headers()
+    assert headers["Authorization"] == "Bearer first_token"
+    assert test_config.get_auth_headers() is headers
+    
+    test_config.set_access_token("second_token", 900)
+    assert test_config.get_auth_headers()["Authorization"] == "Bearer second_token"
+
+
+def test_token_request_data_cached_per_credentials() -> None:
+    """Test that token request data is reused until the credentials change."""
+    test_config = Config()
+    test_config.update(client_id="test_client_id", client_secret="test_client_secret")
+    data = test_config.get_token_request_data()
+    assert data["client_id"] == "test_client_id"
+    assert test_config.get_token_request_data() is data
+    
+    test_config.update(client_secret="other_client_secret")
+    assert test_config.get_token_request_data()["client_secret"] == "other_client_secret"
+
+
+def test_update_skips_unchanged_values(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that updating the config with its current values changes nothing."""
+    test_config = Config()
+    test_config.update(client_id="test_client_id", status_endpoint="https://test-api.example.com/status")
+    status_url_fmt = test_config._status_url_fmt
+    
+    with caplog.at_level(logging.INFO, logger="datacuration_api.config"):
+        test_config.update(client_id=" test_client_id ", status_endpoint="https://test-api.example.com/status")
+    
+    assert "Updating config" not in caplog.text
+    assert test_config._status_url_fmt is status_url_fmt
+
+
+def test_dotenv_loaded_once() -> None:
+    """Test that the .env file is read at most once per process."""
+    with patch("dotenv.load_dotenv") as mock_load_dotenv, \
+         patch.dict(os.environ, {"DATA_CURATION_CLIENT_ID": ""}):
+        _load_dotenv.cache_clear()
+        Config()
+        Config()
+        mock_load_dotenv.assert_called_once()
+
+
+def test_status_url_follows_endpoint_updates() -> None:
+    """Test that status URLs are built from the current status endpoint."""
+    test_config = Config()
+    test_config.update(status_endpoint="https://test-api.example.com/status")
+    assert test_config.get_status_url("test-job-id") == "https://test-api.example.com/status/test-job-id"
+
+
+def test_token_cache(tmp_path: Path) -> None:
+    """Test that tokens are persisted and reused for the same credentials only."""
+    cache_path = tmp_path / "cache" / "token.json"
+    
+    first_config = Config()
+    first_config.update(client_id="test_client_id", token_cache_path=str(cache_path))
+    first_config.set_access_token("test_access_token", 900)
+    assert cache_path.stat().st_mode & 0o777 == 0o600
+    
+    # A new process with the same credentials reuses the token
+    second_config = Config()
+    second_config.update(client_id="test_client_id", token_cache_path=str(cache_path))
+    assert second_config.load_cached_token()
+    assert second_config.access_token == "test_access_token"
+    assert second_config.token_valid()
+    
+    # Tokens issued to other credentials are ignored
+    other_config = Config()
+    other_config.update(client_id="other_client_id", token_cache_path=str(cache_path))
+    assert not other_config.load_cached_token()
+
+
+@pytest.mark.parametrize("expires_at", [None, "soon", [1]])
+def test_token_cache_malformed(tmp_path: Path, expires_at: Any) -> None:
+    """Test that a malformed token cache is ignored instead of failing."""
+    cache_path = tmp_path / "token.json"
+    test_config = Config()
+    test_config.update(client_id="test_client_id", token_cache_path=str(cache_path))
+    cache_path.write_text(json.dumps({
+        "client_id": "test_client_id",
+        "auth_endpoint": test_config.auth_endpoint,
+        "access_token": "test_access_token",
+        "expires_at": expires_at,
+    }))
+    
+    assert not test_config.load_cached_token()
+    assert not test_config.token_valid()
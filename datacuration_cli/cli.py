@@ -5,119 +5,284 @@ This module provides a CLI for interacting with the Hyland Data Curation API,
 allowing users to process files and retrieve curated text.
 """
 
+import os
 import sys
-import json
-from typing import Optional, Dict, Any
-import click
-from pathlib import Path
+import logging
+import argparse
+import tempfile
+from typing import Optional, Dict, Any, List
 
-from datacuration_api import DataCurationClient
-from datacuration_api import config
 from datacuration_cli import __version__
 
+logger = logging.getLogger(__name__)
 
-@click.group()
-@click.option(
-    "--client-id", 
-    envvar="DATA_CURATION_CLIENT_ID",
-    help="Client ID for authentication. Can also be set via DATA_CURATION_CLIENT_ID environment variable."
-)
-@click.option(
-    "--client-secret", 
-    envvar="DATA_CURATION_CLIENT_SECRET",
-    help="Client Secret for authentication. Can also be set via DATA_CURATION_CLIENT_SECRET environment variable."
-)
-@click.option(
-    "--api-url", 
-    envvar="DATA_CURATION_API_URL",
-    help="Base URL for the Data Curation API. Can also be set via DATA_CURATION_API_URL environment variable."
-)
-@click.option(
-    "--auth-url", 
-    envvar="DATA_CURATION_AUTH_ENDPOINT",
-    help="Authentication endpoint URL. Can also be set via DATA_CURATION_AUTH_ENDPOINT environment variable."
-)
-@click.version_option(version=__version__, package_name="datacuration")
-def cli(client_id: Optional[str], client_secret: Optional[str], api_url: Optional[str], auth_url: Optional[str]) -> None:
-    """
-    Data Curation API Client
-    
-    A command-line tool for processing files through the Hyland Data Curation API.
+# Buffer size in bytes used when writing results to a file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Options of the top-level command, passed to cli()
+GLOBAL_OPTIONS = ("client_id", "client_secret", "api_url", "auth_url", "verbose")
+
+# Option flags of the process command copied as is into the processing options
+OPTION_FLAGS = ("chunking", "chunk_size", "embedding", "json_schema")
+
+# Normalization flags of the process command and their key in the normalization options
+NORMALIZATION_FLAGS = (("normalize_quotations", "quotations"), ("normalize_dashes", "dashes"))
+
+# Types of the documented processing options, checked before calling the API
+OPTION_TYPES: Dict[str, type] = {"chunking": bool, "chunk_size": int, "embedding": bool, "json_schema": bool}
+NORMALIZATION_OPTION_TYPES: Dict[str, type] = {"quotations": bool, "dashes": bool}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the CLI.
+    
+    Returns:
+        The parser for the top-level command and its subcommands.
+    """
+    parser = argparse.ArgumentParser(
+        prog="datacuration",
+        description="A command-line tool for processing files through the Hyland Data Curation API."
+    )
+    parser.add_argument(
+        "--client-id",
+        default=os.environ.get("DATA_CURATION_CLIENT_ID"),
+        help="Client ID for authentication. Can also be set via DATA_CURATION_CLIENT_ID environment variable."
+    )
+    parser.add_argument(
+        "--client-secret",
+        default=os.environ.get("DATA_CURATION_CLIENT_SECRET"),
+        help="Client Secret for authentication. Can also be set via DATA_CURATION_CLIENT_SECRET environment variable."
+    )
+    parser.add_argument(
+        "--api-url",
+        default=os.environ.get("DATA_CURATION_API_URL"),
+        help="Base URL for the Data Curation API. Can also be set via DATA_CURATION_API_URL environment variable."
+    )
+    parser.add_argument(
+        "--auth-url",
+        default=os.environ.get("DATA_CURATION_AUTH_ENDPOINT"),
+        help="Authentication endpoint URL. Can also be set via DATA_CURATION_AUTH_ENDPOINT environment variable."
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Log API requests and responses to stderr."
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s, version {__version__}"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+    
+    process_parser = subparsers.add_parser(
+        "process",
+        help="Process files through the Data Curation API.",
+        description=(
+            "Process files through the Data Curation API. Several files are processed "
+            "concurrently; with --output, their results are saved in that directory as "
+            "<file name>.txt. The --options flag overrides individual option flags."
+        )
+    )
+    process_parser.add_argument(
+        "file_paths",
+        nargs="+",
+        metavar="FILE_PATHS",
+        help="Paths to the files to process."
+    )
+    process_parser.add_argument(
+        "--output", "-o",
+        help="Output file path, or output directory when processing several files. "
+             "If not provided, output will be printed to stdout."
+    )
+    process_parser.add_argument(
+        "--chunking",
+        action=argparse.BooleanOptionalAction,
+        help="Enable/disable content chunking."
+    )
+    process_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Target size in characters for each chunk when chunking is enabled."
+    )
+    process_parser.add_argument(
+        "--embedding",
+        action=argparse.BooleanOptionalAction,
+        help="Enable/disable content embedding."
+    )
+    process_parser.add_argument(
+        "--normalize-quotations",
+        action=argparse.BooleanOptionalAction,
+        help="Enable/disable normalization of quotation marks."
+    )
+    process_parser.add_argument(
+        "--normalize-dashes",
+        action=argparse.BooleanOptionalAction,
+        help="Enable/disable normalization of dashes."
+    )
+    process_parser.add_argument(
+        "--json-schema",
+        action=argparse.BooleanOptionalAction,
+        help="Enable/disable structured JSON output format."
+    )
+    process_parser.add_argument(
+        "--options",
+        help="JSON string with all processing options. Overrides individual option flags."
+    )
+    process_parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Don't wait for processing to complete, just return the job details."
+    )
+    process_parser.add_argument(
+        "--max-retries",
+        type=int,
+        help="Maximum number of readiness checks when waiting for results; there is no "
+             "wait after the last one. Defaults to the library default."
+    )
+    process_parser.add_argument(
+        "--retry-delay",
+        type=int,
+        help="Initial delay between checks in seconds. Doubles after each check. "
+             "Defaults to the library default."
+    )
+    process_parser.add_argument(
+        "--max-delay",
+        type=float,
+        help="Maximum delay between checks in seconds. Defaults to the library default."
+    )
+    process_parser.add_argument(
+        "--jitter",
+        type=float,
+        help="Maximum random delay in seconds added to each wait. Defaults to the library default."
+    )
+    process_parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Total time in seconds to wait for results. Overrides --max-retries."
+    )
+    process_parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Maximum number of files processed concurrently when several files are given. "
+             "Defaults to the library default."
+    )
+    process_parser.add_argument(
+        "--pool-size",
+        type=int,
+        help="Maximum number of connections kept open to each host. Defaults to the library default."
+    )
+    
+    return parser
+
+
+def _build_options_dict(**flags: Any) -> Dict[str, Any]:
+    """
+    Build the processing options from individual option flags.
+    
+    Flags that were not given (None) are left out, so the API uses its defaults.
+    
+    Args:
+        **flags: Option flag values, keyed by the names in OPTION_FLAGS and
+            NORMALIZATION_FLAGS.
+        
+    Returns:
+        The processing options dictionary.
+    """
+    options_dict: Dict[str, Any] = {}
+    
+    # Handle normalization options
+    normalization = {
+        key: flags[flag] for flag, key in NORMALIZATION_FLAGS if flags.get(flag) is not None
+    }
+    if normalization:
+        options_dict["normalization"] = normalization
+    
+    # Handle chunking, embedding and output format options
+    for flag in OPTION_FLAGS:
+        if flags.get(flag) is not None:
+            options_dict[flag] = flags[flag]
+    
+    return options_dict
+
+
+def _option_errors(options_dict: Any) -> List[str]:
+    """
+    Check the shape of processing options parsed from JSON.
+    
+    Only the documented options are checked; other keys are left for the API
+    to accept or reject.
+    
+    Args:
+        options_dict: The parsed options.
+        
+    Returns:
+        A description of each invalid option, empty if the options are valid.
+    """
+    if not isinstance(options_dict, dict):
+        return ["options must be a JSON object"]
+    
+    def type_errors(values: Dict[str, Any], types: Dict[str, type], prefix: str) -> List[str]:
+        # bool is a subclass of int, so integers must not be booleans
+        return [
+            f"{prefix}{key} must be {'a boolean' if expected is bool else 'an integer'}"
+            for key, expected in types.items()
+            if key in values and (
+                not isinstance(values[key], expected)
+                or (expected is int and isinstance(values[key], bool))
+            )
+        ]
+    
+    errors = type_errors(options_dict, OPTION_TYPES, "")
+    normalization = options_dict.get("normalization")
+    if normalization is not None:
+        if isinstance(normalization, dict):
+            errors += type_errors(normalization, NORMALIZATION_OPTION_TYPES, "normalization.")
+        else:
+            errors.append("normalization must be a JSON object")
+    return errors
+
+
+def cli(
+    client_id: Optional[str],
+    client_secret: Optional[str],
+    api_url: Optional[str],
+    auth_url: Optional[str],
+    verbose: bool
+) -> None:
+    """
+    Apply the options of the top-level command.
+    
+    Args:
+        client_id: Optional client ID.
+        client_secret: Optional client secret.
+        api_url: Optional base URL for the Data Curation API.
+        auth_url: Optional authentication endpoint URL.
+        verbose: Whether to log API requests and responses.
     """
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.WARNING)
+    
+    # Imported here so --help and --version don't pay for loading the API client
+    from datacuration_api import config
+    
     if client_id:
         config.update(client_id=client_id)
     if client_secret:
         config.update(client_secret=client_secret)
     if api_url:
-        config.update(api_base_url=api_url)
-        config.update(presign_endpoint=f"{api_url}/presign")
-        config.update(status_endpoint=f"{api_url}/status")
+        config.update(
+            api_base_url=api_url,
+            presign_endpoint=api_url + "/presign",
+            status_endpoint=api_url + "/status"
+        )
     if auth_url:
         config.update(auth_endpoint=auth_url)
 
 
-@cli.command()
-@click.argument("file_path", type=click.Path(exists=True))
-@click.option(
-    "--output", "-o",
-    type=click.Path(),
-    help="Output file path. If not provided, output will be printed to stdout."
-)
-@click.option(
-    "--chunking/--no-chunking",
-    default=None,
-    help="Enable/disable content chunking."
-)
-@click.option(
-    "--chunk-size",
-    type=int,
-    default=None,
-    help="Target size in characters for each chunk when chunking is enabled."
-)
-@click.option(
-    "--embedding/--no-embedding",
-    default=None,
-    help="Enable/disable content embedding."
-)
-@click.option(
-    "--normalize-quotations/--no-normalize-quotations",
-    default=None,
-    help="Enable/disable normalization of quotation marks."
-)
-@click.option(
-    "--normalize-dashes/--no-normalize-dashes",
-    default=None,
-    help="Enable/disable normalization of dashes."
-)
-@click.option(
-    "--json-schema/--no-json-schema",
-    default=None,
-    help="Enable/disable structured JSON output format."
-)
-@click.option(
-    "--options",
-    type=str,
-    help="JSON string with all processing options. Overrides individual option flags."
-)
-@click.option(
-    "--no-wait",
-    is_flag=True,
-    help="Don't wait for processing to complete, just return the job details."
-)
-@click.option(
-    "--max-retries",
-    type=int,
-    default=10,
-    help="Maximum number of retries when waiting for results."
-)
-@click.option(
-    "--retry-delay",
-    type=int,
-    default=2,
-    help="Delay between retries in seconds."
-)
 def process(
-    file_path: str,
+    file_paths: List[str],
     output: Optional[str],
     chunking: Optional[bool],
     chunk_size: Optional[int],
@@ -127,80 +292,226 @@ def process(
     json_schema: Optional[bool],
     options: Optional[str],
     no_wait: bool,
-    max_retries: int,
-    retry_delay: int,
+    max_retries: Optional[int],
+    retry_delay: Optional[int],
+    max_delay: Optional[float],
+    jitter: Optional[float],
+    timeout: Optional[float],
+    concurrency: Optional[int],
+    pool_size: Optional[int],
 ) -> None:
     """
-    Process a file through the Data Curation API.
+    Process files through the Data Curation API.
     
-    FILE_PATH is the path to the file to process.
+    Several files are processed concurrently; with an output path, their
+    results are saved in that directory as <file name>.txt. The options JSON
+    string overrides individual option flags. Polling and connection
+    settings left as None fall back to the library defaults.
     
-    Use individual option flags for basic configuration or the --options flag
-    with a JSON string for advanced configuration. The --options flag overrides
-    individual option flags.
+    Args:
+        file_paths: Paths to the files to process.
+        output: Optional output file, or output directory for several files.
+        chunking: Optional chunking flag.
+        chunk_size: Optional chunk size in characters.
+        embedding: Optional embedding flag.
+        normalize_quotations: Optional quotation mark normalization flag.
+        normalize_dashes: Optional dash normalization flag.
+        json_schema: Optional structured JSON output flag.
+        options: Optional JSON string with all processing options.
+        no_wait: Whether to return the job details without waiting for results.
+        max_retries: Optional maximum number of readiness checks.
+        retry_delay: Optional initial delay between checks in seconds.
+        max_delay: Optional maximum delay between checks in seconds.
+        jitter: Optional maximum random delay in seconds added to each wait.
+        timeout: Optional total time in seconds to wait for results.
+        concurrency: Optional maximum number of files processed concurrently.
+        pool_size: Optional maximum number of connections kept open to each host.
     """
+    # The library's JSON helpers use orjson when it is installed
+    from datacuration_api import DataCurationClient, decode_options, encode_options
+    
     # Parse options from JSON string if provided
     if options:
         try:
-            options_dict: Dict[str, Any] = json.loads(options)
-            click.echo(f"Using options from JSON: {json.dumps(options_dict, indent=2)}")
-        except json.JSONDecodeError as e:
-            click.echo(f"Error parsing options JSON: {str(e)}", err=True)
+            options_dict: Dict[str, Any] = decode_options(options)
+        except ValueError as e:
+            print(f"Error parsing options JSON: {str(e)}", file=sys.stderr)
             sys.exit(1)
+        # Reject malformed options before making any API request
+        errors = _option_errors(options_dict)
+        if errors:
+            print(f"Invalid options: {'; '.join(errors)}", file=sys.stderr)
+            sys.exit(2)
+        # Echo the options as given; only re-serialize them for verbose logs
+        print(f"Using options from JSON: {options}")
+        if logger.isEnabledFor(logging.DEBUG):
+            import json
+            logger.debug("Parsed options: %s", json.dumps(options_dict, indent=2))
     else:
-        # Build options dictionary from provided flags
-        options_dict = {}
+        options_dict = _build_options_dict(
+            chunking=chunking,
+            chunk_size=chunk_size,
+            embedding=embedding,
+            normalize_quotations=normalize_quotations,
+            normalize_dashes=normalize_dashes,
+            json_schema=json_schema
+        )
+    
+    # Encode the options once; the client sends the encoded body as is
+    options_body = encode_options(options if options else options_dict)
+    
+    # Only pass the settings given on the command line, so the library
+    # defaults stay the single source for the others
+    polling = dict(
+        max_retries=max_retries,
+        retry_delay=retry_delay,
+        max_delay=max_delay,
+        jitter=jitter,
+        timeout=timeout
+    )
+    process_kwargs: Dict[str, Any] = {name: value for name, value in polling.items() if value is not None}
+    process_kwargs["wait"] = not no_wait
+    client_kwargs: Dict[str, Any] = {} if pool_size is None else {"pool_size": pool_size}
+    batch_kwargs: Dict[str, Any] = {} if concurrency is None else {"max_workers": concurrency}
+    
+    try:
+        # Create the output directory before processing anything, so a bad
+        # output path does not throw away finished results
+        if output and len(file_paths) > 1:
+            os.makedirs(output, exist_ok=True)
         
-        # Handle normalization options
-        if normalize_quotations is not None or normalize_dashes is not None:
-            options_dict["normalization"] = {}
+        with DataCurationClient(**client_kwargs) as client:
+            if len(file_paths) == 1 and output and not no_wait:
+                # Stream the results to disk rather than holding them in memory
+                del process_kwargs["wait"]
+                _process_to_file(client, file_paths[0], output, options_body, process_kwargs)
+                print(f"Results saved to {output}")
+                return
             
-            if normalize_quotations is not None:
-                options_dict["normalization"]["quotations"] = normalize_quotations
-                
-            if normalize_dashes is not None:
-                options_dict["normalization"]["dashes"] = normalize_dashes
-        
-        # Handle chunking options
-        if chunking is not None:
-            options_dict["chunking"] = chunking
+            if len(file_paths) == 1:
+                result = client.process_file(file_paths[0], options=options_body, **process_kwargs)
+                _write_result(result, output)
+                return
             
-        if chunk_size is not None:
-            options_dict["chunk_size"] = chunk_size
-        
-        # Handle embedding options
-        if embedding is not None:
-            options_dict["embedding"] = embedding
+            results = client.process_files(
+                list(file_paths),
+                options=options_body,
+                **batch_kwargs,
+                **process_kwargs
+            )
         
-        # Handle output format options
-        if json_schema is not None:
-            options_dict["json_schema"] = json_schema
-    
-    try:
-        client = DataCurationClient()
-        result = client.process_file(
-            file_path,
-            options=options_dict,
-            wait=not no_wait,
-            max_retries=max_retries,
-            retry_delay=retry_delay
-        )
-        
-        if output:
-            with open(output, "w") as f:
-                f.write(result)
-            click.echo(f"Results saved to {output}")
-        else:
-            click.echo(result)
+        for file_path, result in zip(file_paths, results):
+            _write_result(result, os.path.join(output, f"{os.path.basename(file_path)}.txt") if output else None)
             
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
+        print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
 
-def main() -> None:
-    """Entry point for the CLI."""
-    cli()
+def _process_to_file(
+    client: Any,
+    file_path: str,
+    output: str,
+    options_body: bytes,
+    process_kwargs: Dict[str, Any]
+) -> None:
+    """
+    Process a file and stream its results to an output file.
+    
+    The results are written to a temporary file in the output directory, which
+    replaces the output file only once processing succeeded, so a failure never
+    leaves a truncated output or clobbers an existing one.
+    
+    Args:
+        client: The DataCurationClient to process the file with.
+        file_path: Path to the file to process.
+        output: Output file path.
+        options_body: The encoded processing options.
+        process_kwargs: Additional arguments passed to process_file_to().
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(output)),
+        prefix=f".{os.path.basename(output)}.",
+        suffix=".tmp"
+    )
+    try:
+        # mkstemp creates the file readable by the owner only; use the
+        # permissions a regular open() would have given the output file
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        
+        with open(fd, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            client.process_file_to(file_path, f, options=options_body, **process_kwargs)
+        os.replace(tmp_path, output)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _write_result(result: str, output: Optional[str]) -> None:
+    """
+    Write a result to a file, or to stdout if no output path is given.
+    
+    Args:
+        result: The result returned by the API.
+        output: Optional output file path.
+    """
+    # Write the encoded result in one go through a large buffer rather than
+    # through a text layer
+    data = result.encode("utf-8")
+    if output:
+        with open(output, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(data)
+        print(f"Results saved to {output}")
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Entry point for the CLI.
+    
+    Args:
+        argv: Optional command-line arguments. Defaults to sys.argv[1:].
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Answer version probes without building the parser for every subcommand
+    if argv == ["--version"]:
+        print(f"datacuration, version {__version__}")
+        return
+    
+    parser = _build_parser()
+    arguments = vars(parser.parse_args(argv))
+    command = arguments.pop("command")
+    
+    cli(**{name: arguments.pop(name) for name in GLOBAL_OPTIONS})
+    
+    if command == "process":
+        for file_path in arguments["file_paths"]:
+            if not os.path.exists(file_path):
+                parser.error(f"argument FILE_PATHS: path '{file_path}' does not exist")
+        
+        # Results of several files are saved as <file name>.txt in the output directory
+        if arguments["output"] and len(arguments["file_paths"]) > 1:
+            seen = set()
+            for file_path in arguments["file_paths"]:
+                name = os.path.basename(file_path)
+                if name in seen:
+                    parser.error(
+                        f"argument FILE_PATHS: several files are named '{name}', "
+                        "their results would overwrite each other in the output directory"
+                    )
+                seen.add(name)
+        process(**arguments)
 
 
 if __name__ == "__main__":
@@ -5,44 +5,108 @@ Tests for the Data Curation API CLI.
 import os
 import json
 import pytest
-from unittest.mock import patch, MagicMock
-from click.testing import CliRunner
+from unittest.mock import patch, MagicMock, ANY
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, BinaryIO, Generator, List, NamedTuple
 
-from datacuration_cli.cli import cli, process
+from datacuration_cli.cli import _build_options_dict, main
 
 
-@pytest.fixture
-def runner() -> CliRunner:
-    """Fixture to create a CLI runner."""
-    return CliRunner()
+class CliResult(NamedTuple):
+    """Exit code and combined stdout and stderr of a CLI run."""
+    
+    exit_code: int
+    output: str
+
+
+def invoke(capsys: pytest.CaptureFixture[str], args: List[str]) -> CliResult:
+    """Run the CLI with the given arguments and capture its output."""
+    try:
+        main(args)
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    captured = capsys.readouterr()
+    return CliResult(exit_code, captured.out + captured.err)
 
 
 @pytest.fixture
 def mock_api_client() -> Generator[MagicMock, None, None]:
     """Fixture to create a mock API client."""
-    with patch("datacuration_cli.cli.DataCurationClient") as mock_client_class:
+    with patch("datacuration_api.DataCurationClient") as mock_client_class:
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
+        mock_client.__enter__.return_value = mock_client
         yield mock_client
 
 
-def test_cli_version(runner: CliRunner) -> None:
+def test_cli_version(capsys: pytest.CaptureFixture[str]) -> None:
     """Test the CLI version command."""
-    result = runner.invoke(cli, ["--version"])
+    with patch("datacuration_cli.cli._build_parser") as mock_build_parser:
+        result = invoke(capsys, ["--version"])
     assert result.exit_code == 0
     assert "version" in result.output.lower()
+    mock_build_parser.assert_not_called()
 
 
-def test_cli_auth_options(runner: CliRunner) -> None:
+def test_cli_auth_options(capsys: pytest.CaptureFixture[str]) -> None:
     """Test the CLI authentication options."""
     # Skip this test since we can't easily test the CLI options directly
     # The functionality is tested through the other tests
     pass
 
 
-def test_process_command(runner: CliRunner, mock_api_client: MagicMock, tmp_path: Path) -> None:
+def test_cli_api_url(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test that --api-url sets all API endpoints in one config update."""
+    test_file = tmp_path / "test_file.txt"
+    test_file.write_text("Test content")
+    mock_api_client.process_file.return_value = "Curated text content"
+    
+    with patch("datacuration_api.config") as mock_config:
+        result = invoke(capsys, ["--api-url", "https://test-api.example.com", "process", str(test_file)])
+    
+    assert result.exit_code == 0
+    mock_config.update.assert_called_once_with(
+        api_base_url="https://test-api.example.com",
+        presign_endpoint="https://test-api.example.com/presign",
+        status_endpoint="https://test-api.example.com/status"
+    )
+
+
+def test_cli_api_url_from_dotenv(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test that an API URL set only in the .env file moves every API endpoint."""
+    import dotenv
+    from datacuration_api.config import ENV_VARS, Config, _load_dotenv
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("DATA_CURATION_API_URL=https://staging.example.test/api\n")
+    test_file = tmp_path / "test_file.txt"
+    test_file.write_text("Test content")
+    mock_api_client.process_file.return_value = "Curated text content"
+    
+    load_dotenv = dotenv.load_dotenv
+    with patch.dict(os.environ), \
+         patch("dotenv.load_dotenv", side_effect=lambda: load_dotenv(env_file)):
+        for name in ENV_VARS + ("DATA_CURATION_PRESIGN_ENDPOINT", "DATA_CURATION_STATUS_ENDPOINT"):
+            os.environ.pop(name, None)
+        _load_dotenv.cache_clear()
+        
+        test_config = Config()
+        
+        # The CLI reads its option defaults before importing the library, that
+        # is before the .env file is loaded
+        os.environ.pop("DATA_CURATION_API_URL")
+        with patch("datacuration_api.config", test_config):
+            result = invoke(capsys, ["process", str(test_file)])
+    _load_dotenv.cache_clear()
+    
+    assert result.exit_code == 0
+    assert test_config.api_base_url == "https://staging.example.test/api"
+    assert test_config.presign_endpoint == "https://staging.example.test/api/presign"
+    assert test_config.get_status_url("job") == "https://staging.example.test/api/status/job"
+
+
+def test_process_command(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
     """Test the process command."""
     # Create a test file
     test_file = tmp_path / "test_file.txt"
@@ -52,7 +116,7 @@ def test_process_command(runner: CliRunner, mock_api_client: MagicMock, tmp_path
     mock_api_client.process_file.return_value = "Curated text content"
     
     # Run the command
-    result = runner.invoke(cli, ["process", str(test_file)])
+    result = invoke(capsys, ["process", str(test_file)])
     
     # Verify the result
     assert result.exit_code == 0
@@ -61,14 +125,38 @@ def test_process_command(runner: CliRunner, mock_api_client: MagicMock, tmp_path
     # Verify the API client was called correctly
     mock_api_client.process_file.assert_called_once_with(
         str(test_file),
-        options={},
+        options=b"{}",
+        wait=True
+    )
+
+
+def test_process_command_with_polling_options(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test that the process command passes only the polling settings it is given."""
+    test_file = tmp_path / "test_file.txt"
+    test_file.write_text("Test content")
+    
+    mock_api_client.process_file.return_value = "Curated text content"
+    
+    result = invoke(capsys, [
+        "process",
+        str(test_file),
+        "--max-retries", "3",
+        "--max-delay", "5",
+        "--timeout", "60"
+    ])
+    
+    assert result.exit_code == 0
+    mock_api_client.process_file.assert_called_once_with(
+        str(test_file),
+        options=b"{}",
         wait=True,
-        max_retries=10,
-        retry_delay=2
+        max_retries=3,
+        max_delay=5.0,
+        timeout=60.0
     )
 
 
-def test_process_command_with_options(runner: CliRunner, mock_api_client: MagicMock, tmp_path: Path) -> None:
+def test_process_command_with_options(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
     """Test the process command with options."""
     # Create a test file
     test_file = tmp_path / "test_file.txt"
@@ -78,7 +166,7 @@ def test_process_command_with_options(runner: CliRunner, mock_api_client: MagicM
     mock_api_client.process_file.return_value = "Curated text content"
     
     # Run the command with options
-    result = runner.invoke(cli, [
+    result = invoke(capsys, [
         "process",
         str(test_file),
         "--chunking",
@@ -89,7 +177,10 @@ def test_process_command_with_options(runner: CliRunner, mock_api_client: MagicM
         "--json-schema",
         "--no-wait",
         "--max-retries", "5",
-        "--retry-delay", "3"
+        "--retry-delay", "3",
+        "--max-delay", "10",
+        "--jitter", "0",
+        "--timeout", "60"
     ])
     
     # Verify the result
@@ -98,23 +189,27 @@ def test_process_command_with_options(runner: CliRunner, mock_api_client: MagicM
     # Verify the API client was called correctly with the options
     mock_api_client.process_file.assert_called_once_with(
         str(test_file),
-        options={
-            "chunking": True,
-            "chunk_size": 2000,
-            "embedding": False,
-            "normalization": {
-                "quotations": True,
-                "dashes": False
-            },
-            "json_schema": True
-        },
+        options=ANY,
         wait=False,
         max_retries=5,
-        retry_delay=3
+        retry_delay=3,
+        max_delay=10.0,
+        jitter=0.0,
+        timeout=60.0
     )
+    assert json.loads(mock_api_client.process_file.call_args.kwargs["options"]) == {
+        "chunking": True,
+        "chunk_size": 2000,
+        "embedding": False,
+        "normalization": {
+            "quotations": True,
+            "dashes": False
+        },
+        "json_schema": True
+    }
 
 
-def test_process_command_with_output_file(runner: CliRunner, mock_api_client: MagicMock, tmp_path: Path) -> None:
+def test_process_command_with_output_file(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
     """Test the process command with output file."""
     # Create a test file
     test_file = tmp_path / "test_file.txt"
@@ -123,11 +218,14 @@ def test_process_command_with_output_file(runner: CliRunner, mock_api_client: Ma
     # Create an output file path
     output_file = tmp_path / "output.txt"
     
-    # Set up the mock API client
-    mock_api_client.process_file.return_value = "Curated text content"
+    # Set up the mock API client to stream the results to the output file
+    def process_file_to(file_path: str, output: BinaryIO, **kwargs: Any) -> int:
+        return output.write(b"Curated text content")
+    
+    mock_api_client.process_file_to.side_effect = process_file_to
     
     # Run the command with output file
-    result = runner.invoke(cli, [
+    result = invoke(capsys, [
         "process",
         str(test_file),
         "--output", str(output_file)
@@ -136,12 +234,120 @@ def test_process_command_with_output_file(runner: CliRunner, mock_api_client: Ma
     # Verify the result
     assert result.exit_code == 0
     assert f"Results saved to {output_file}" in result.output
+    mock_api_client.process_file.assert_not_called()
+    assert "wait" not in mock_api_client.process_file_to.call_args.kwargs
     
     # Verify the output file was created with the correct content
     assert output_file.read_text() == "Curated text content"
 
 
-def test_process_command_with_json_options(runner: CliRunner, mock_api_client: MagicMock, tmp_path: Path) -> None:
+def test_process_command_with_output_file_error(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test that a failed run leaves an existing output file untouched."""
+    test_file = tmp_path / "test_file.txt"
+    test_file.write_text("Test content")
+    
+    output_file = tmp_path / "output.txt"
+    output_file.write_text("Previous result")
+    
+    # Fail after part of the results has been streamed
+    def process_file_to(file_path: str, output: BinaryIO, **kwargs: Any) -> int:
+        output.write(b"Partial")
+        raise TimeoutError("Processing timed out after 10 retries")
+    
+    mock_api_client.process_file_to.side_effect = process_file_to
+    
+    result = invoke(capsys, ["process", str(test_file), "--output", str(output_file)])
+    
+    assert result.exit_code == 1
+    assert "Error: Processing timed out" in result.output
+    assert output_file.read_text() == "Previous result"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["output.txt", "test_file.txt"]
+
+
+def test_process_command_with_multiple_files(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test the process command with several files and an output directory."""
+    # Create test files
+    test_files = [tmp_path / "first.pdf", tmp_path / "second.pdf"]
+    for test_file in test_files:
+        test_file.write_text("Test content")
+    
+    output_dir = tmp_path / "results"
+    
+    # Set up the mock API client
+    mock_api_client.process_files.return_value = ["First result", "Second result"]
+    
+    # Run the command with several files
+    result = invoke(capsys, [
+        "process",
+        *[str(test_file) for test_file in test_files],
+        "--output", str(output_dir),
+        "--concurrency", "2"
+    ])
+    
+    # Verify the result
+    assert result.exit_code == 0
+    assert mock_api_client.process_files.call_args.args[0] == [str(test_file) for test_file in test_files]
+    assert mock_api_client.process_files.call_args.kwargs["max_workers"] == 2
+    
+    # Verify each result was saved in the output directory
+    assert (output_dir / "first.pdf.txt").read_text() == "First result"
+    assert (output_dir / "second.pdf.txt").read_text() == "Second result"
+
+
+def test_process_command_with_duplicate_file_names(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test that files whose results would share an output file are rejected."""
+    test_files = [tmp_path / "a" / "x.pdf", tmp_path / "b" / "x.pdf"]
+    for test_file in test_files:
+        test_file.parent.mkdir()
+        test_file.write_text("Test content")
+    
+    result = invoke(capsys, [
+        "process",
+        *[str(test_file) for test_file in test_files],
+        "--output", str(tmp_path / "results")
+    ])
+    
+    assert result.exit_code == 2
+    assert "several files are named 'x.pdf'" in result.output
+    mock_api_client.process_files.assert_not_called()
+
+
+def test_process_command_with_invalid_output_dir(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test that a bad output directory is reported before any file is processed."""
+    test_files = [tmp_path / "first.pdf", tmp_path / "second.pdf"]
+    for test_file in test_files:
+        test_file.write_text("Test content")
+    
+    output_file = tmp_path / "results"
+    output_file.write_text("Not a directory")
+    
+    result = invoke(capsys, [
+        "process",
+        *[str(test_file) for test_file in test_files],
+        "--output", str(output_file)
+    ])
+    
+    assert result.exit_code == 1
+    assert "Error:" in result.output
+    mock_api_client.process_files.assert_not_called()
+
+
+def test_process_command_with_pool_size(capsys: pytest.CaptureFixture[str], tmp_path: Path) -> None:
+    """Test that the process command sizes the client's connection pools."""
+    test_file = tmp_path / "test_file.txt"
+    test_file.write_text("Test content")
+    
+    with patch("datacuration_api.DataCurationClient") as mock_client_class:
+        mock_client = mock_client_class.return_value.__enter__.return_value
+        mock_client.process_file.return_value = "Curated text content"
+        
+        result = invoke(capsys, ["process", str(test_file), "--pool-size", "4"])
+    
+    assert result.exit_code == 0
+    mock_client_class.assert_called_once_with(pool_size=4)
+
+
+def test_process_command_with_json_options(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
     """Test the process command with JSON options."""
     # Create a test file
     test_file = tmp_path / "test_file.txt"
@@ -163,7 +369,7 @@ def test_process_command_with_json_options(runner: CliRunner, mock_api_client: M
     })
     
     # Run the command with JSON options
-    result = runner.invoke(cli, [
+    result = invoke(capsys, [
         "process",
         str(test_file),
         "--options", options_json
@@ -171,28 +377,42 @@ def test_process_command_with_json_options(runner: CliRunner, mock_api_client: M
     
     # Verify the result
     assert result.exit_code == 0
+    assert f"Using options from JSON: {options_json}" in result.output
     
-    # Parse the expected options
-    expected_options = json.loads(options_json)
-    
-    # Verify the API client was called correctly with the JSON options
+    # Verify the API client was called with the JSON options as given
     mock_api_client.process_file.assert_called_once_with(
         str(test_file),
-        options=expected_options,
-        wait=True,
-        max_retries=10,
-        retry_delay=2
+        options=options_json.encode("utf-8"),
+        wait=True
     )
 
 
-def test_process_command_with_invalid_json_options(runner: CliRunner, mock_api_client: MagicMock, tmp_path: Path) -> None:
+def test_build_options_dict() -> None:
+    """Test that only the given option flags end up in the options."""
+    assert _build_options_dict(chunking=None, normalize_dashes=None) == {}
+    assert _build_options_dict(
+        chunking=True,
+        chunk_size=500,
+        embedding=False,
+        normalize_quotations=None,
+        normalize_dashes=True,
+        json_schema=None
+    ) == {
+        "normalization": {"dashes": True},
+        "chunking": True,
+        "chunk_size": 500,
+        "embedding": False,
+    }
+
+
+def test_process_command_with_invalid_json_options(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
     """Test the process command with invalid JSON options."""
     # Create a test file
     test_file = tmp_path / "test_file.txt"
     test_file.write_text("Test content")
     
     # Run the command with invalid JSON options
-    result = runner.invoke(cli, [
+    result = invoke(capsys, [
         "process",
         str(test_file),
         "--options", "{invalid json"
@@ -203,7 +423,34 @@ def test_process_command_with_invalid_json_options(runner: CliRunner, mock_api_c
     assert "Error parsing options JSON" in result.output
 
 
-def test_process_command_error(runner: CliRunner, mock_api_client: MagicMock, tmp_path: Path) -> None:
+def test_process_command_with_invalid_options(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test that malformed options are rejected before calling the API."""
+    test_file = tmp_path / "test_file.txt"
+    test_file.write_text("Test content")
+    
+    result = invoke(capsys, [
+        "process",
+        str(test_file),
+        "--options", '{"chunk_size": true, "normalization": {"dashes": "yes"}}'
+    ])
+    
+    assert result.exit_code == 2
+    assert "chunk_size must be an integer" in result.output
+    assert "normalization.dashes must be a boolean" in result.output
+    mock_api_client.process_file.assert_not_called()
+
+
+def test_process_command_missing_file(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
+    """Test the process command with a file that does not exist."""
+    result = invoke(capsys, ["process", str(tmp_path / "missing.pdf")])
+    
+    # Verify the usage error is reported before calling the API
+    assert result.exit_code == 2
+    assert "does not exist" in result.output
+    mock_api_client.process_file.assert_not_called()
+
+
+def test_process_command_error(capsys: pytest.CaptureFixture[str], mock_api_client: MagicMock, tmp_path: Path) -> None:
     """Test the process command with an error."""
     # Create a test file
     test_file = tmp_path / "test_file.txt"
@@ -213,7 +460,7 @@ def test_process_command_error(runner: CliRunner, mock_api_client: MagicMock, tm
     mock_api_client.process_file.side_effect = ValueError("Test error")
     
     # Run the command
-    result = runner.invoke(cli, ["process", str(test_file)])
+    result = invoke(capsys, ["process", str(test_file)])
     
     # Verify the result
     assert result.exit_code == 1
@@ -11,40 +11,35 @@ import pytest
 import tempfile
 import logging
 from pathlib import Path
-from click.testing import CliRunner
 from unittest.mock import patch
 
-from datacuration_cli.cli import cli
+from datacuration_cli.cli import main
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+# Log through pytest's logging capture; run with --log-cli-level=INFO to see it
 logger = logging.getLogger(__name__)
 
 
 # Mark all tests in this file as integration tests
 pytestmark = pytest.mark.integration
 
-
-@pytest.fixture
-def runner() -> CliRunner:
-    """Fixture to create a CLI runner."""
-    return CliRunner(env=os.environ)
+# Repository paths, resolved once at import
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+TESTS_DATA_DIR = REPO_ROOT / "tests" / "data"
+PDF_PATH = TESTS_DATA_DIR / "2412.05958v1.pdf"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pdf_file() -> str:
-    """Fixture to get the path to the test PDF file."""
-    # The PDF file is in the tests/data directory
-    pdf_path = Path(__file__).parent.parent.parent / "tests" / "data" / "2412.05958v1.pdf"
-    if not pdf_path.exists():
-        pytest.skip(f"Test PDF file not found at {pdf_path}")
-    return str(pdf_path)
+    """Fixture to get the path to the test PDF file, checked once per session."""
+    if not PDF_PATH.exists():
+        pytest.skip(f"Test PDF file not found at {PDF_PATH}")
+    return str(PDF_PATH)
 
 
 @pytest.fixture
 def load_env() -> dict:
     """Fixture to load environment variables from .env file if present."""
-    env_path = Path(__file__).parent.parent.parent / ".env"
+    env_path = REPO_ROOT / ".env"
     if env_path.exists():
         # Use python-dotenv to load the .env file
         from dotenv import load_dotenv
@@ -69,29 +64,29 @@ def load_env() -> dict:
         "DATA_CURATION_API_URL": os.environ.get("DATA_CURATION_API_URL", "https://knowledge-enrichment.ai.experience.hyland.com/latest/api/data-curation").strip()
     }
     
-    # Log environment variables (masking secrets)
-    logger.info("Environment variables:")
-    logger.info(f"DATA_CURATION_CLIENT_ID: {'*' * 5 if env_vars['DATA_CURATION_CLIENT_ID'] else 'not set'}")
-    logger.info(f"DATA_CURATION_CLIENT_SECRET: {'*' * 5 if env_vars['DATA_CURATION_CLIENT_SECRET'] else 'not set'}")
-    logger.info(f"DATA_CURATION_AUTH_ENDPOINT: {env_vars['DATA_CURATION_AUTH_ENDPOINT']}")
-    logger.info(f"DATA_CURATION_API_URL: {env_vars['DATA_CURATION_API_URL']}")
-    
-    # Log the length of each value to help debug any trailing whitespace issues
-    logger.info(f"DATA_CURATION_CLIENT_ID length: {len(env_vars['DATA_CURATION_CLIENT_ID'])}")
-    logger.info(f"DATA_CURATION_CLIENT_SECRET length: {len(env_vars['DATA_CURATION_CLIENT_SECRET'])}")
-    logger.info(f"DATA_CURATION_AUTH_ENDPOINT length: {len(env_vars['DATA_CURATION_AUTH_ENDPOINT'])}")
-    logger.info(f"DATA_CURATION_API_URL length: {len(env_vars['DATA_CURATION_API_URL'])}")
+    # Log environment variables (masking secrets), only when INFO logs are shown
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Environment variables:")
+        logger.info("DATA_CURATION_CLIENT_ID: %s", '*' * 5 if env_vars['DATA_CURATION_CLIENT_ID'] else 'not set')
+        logger.info("DATA_CURATION_CLIENT_SECRET: %s", '*' * 5 if env_vars['DATA_CURATION_CLIENT_SECRET'] else 'not set')
+        logger.info("DATA_CURATION_AUTH_ENDPOINT: %s", env_vars['DATA_CURATION_AUTH_ENDPOINT'])
+        logger.info("DATA_CURATION_API_URL: %s", env_vars['DATA_CURATION_API_URL'])
+        
+        # Log the length of each value to help debug any trailing whitespace issues
+        logger.info("DATA_CURATION_CLIENT_ID length: %s", len(env_vars['DATA_CURATION_CLIENT_ID']))
+        logger.info("DATA_CURATION_CLIENT_SECRET length: %s", len(env_vars['DATA_CURATION_CLIENT_SECRET']))
+        logger.info("DATA_CURATION_AUTH_ENDPOINT length: %s", len(env_vars['DATA_CURATION_AUTH_ENDPOINT']))
+        logger.info("DATA_CURATION_API_URL length: %s", len(env_vars['DATA_CURATION_API_URL']))
     
     return env_vars
 
 
 @pytest.mark.integration
-def test_process_pdf_file(runner: CliRunner, pdf_file: str, load_env: dict) -> None:
+def test_process_pdf_file(capsys: pytest.CaptureFixture[str], pdf_file: str, load_env: dict) -> None:
     """Test processing a PDF file with the actual API."""
     # Log test information
-    logger.info(f"Starting integration test with PDF file: {pdf_file}")
-    logger.info(f"PDF file exists: {Path(pdf_file).exists()}")
-    logger.info(f"PDF file size: {Path(pdf_file).stat().st_size} bytes")
+    logger.info("Starting integration test with PDF file: %s", pdf_file)
+    logger.info("PDF file size: %s bytes", os.stat(pdf_file).st_size)
     
     # Create a temporary file for the output
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp_file:
@@ -99,7 +94,7 @@ def test_process_pdf_file(runner: CliRunner, pdf_file: str, load_env: dict) -> N
     
     # Build command arguments
     api_url = load_env["DATA_CURATION_API_URL"]
-    logger.info(f"Using API URL: {api_url}")
+    logger.info("Using API URL: %s", api_url)
     
     cmd_args = [
         "--client-id", load_env["DATA_CURATION_CLIENT_ID"],
@@ -110,22 +105,28 @@ def test_process_pdf_file(runner: CliRunner, pdf_file: str, load_env: dict) -> N
         pdf_file,
         "--output", output_path
     ]
-    logger.info(f"Command arguments: {' '.join([arg if not arg.startswith('--client') else arg for arg in cmd_args])}")
+    logger.info("Command arguments: %s", ' '.join([arg if not arg.startswith('--client') else arg for arg in cmd_args]))
     
     try:
         # Run the CLI command to process the PDF file with environment variables
         logger.info("Invoking CLI command...")
-        result = runner.invoke(cli, cmd_args)
+        try:
+            main(cmd_args)
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        captured = capsys.readouterr()
+        output = captured.out + captured.err
         
         # Log the result
-        logger.info(f"Command exit code: {result.exit_code}")
-        logger.info(f"Command output: {result.output}")
+        logger.info("Command exit code: %s", exit_code)
+        logger.info("Command output: %s", output)
         
         # Check that the command executed successfully
-        assert result.exit_code == 0, f"Command failed with output: {result.output}"
+        assert exit_code == 0, f"Command failed with output: {output}"
         
         # Check that the output file was created
-        assert Path(output_path).exists(), "Output file was not created"
+        assert os.path.exists(output_path), "Output file was not created"
         
         # Load the output file and check its content
         with open(output_path, "r") as f:
@@ -146,5 +147,7 @@ def test_process_pdf_file(runner: CliRunner, pdf_file: str, load_env: dict) -> N
     
     finally:
         # Clean up the temporary file
-        if Path(output_path).exists():
-            Path(output_path).unlink()
+        try:
+            os.unlink(output_path)
+        except FileNotFoundError:
+            pass